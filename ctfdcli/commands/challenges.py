@@ -2,19 +2,108 @@
 
 import typer
 import re
+import functools
+import shutil
+import subprocess
+import urllib.parse
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich.columns import Columns
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, NamedTuple, Tuple
 
-from ..core import ConfigManager, CTFdClient
+from ..core import get_config_manager, CTFdClient
 from ..utils import show_subcommands
 
 app = typer.Typer(help="List and manage challenges")
 console = Console()
 
+# Connection-info formats, tried in order with a single match at the start of
+# the string. The name of the last matched group identifies the format.
+_CONNECTION_RE = re.compile(
+    r'(?P<url>https?://)'
+    r'|nc\s+(?P<nc_host>[a-zA-Z0-9.-]+)\s+(?P<nc_port>\d+)'
+    r'|(?P<ssh>ssh )'
+    r'|(?P<telnet>telnet )'
+    r'|(?P<host>[a-zA-Z0-9.-]+):(?P<port>\d+)'
+)
+
+_TYPE_SHORT = {
+    "standard": "STD",
+    "multiple_choice": "MC",
+    "dynamic": "DYN",
+    "static": "STC",
+    "regex": "RGX",
+    "code": "CODE",
+    "upload": "UPL",
+    "king_of_the_hill": "KOTH"
+}
+
+_TYPE_FULL = {
+    "standard": "📝 Standard",
+    "multiple_choice": "☑️ Multiple Choice",
+    "dynamic": "⚡ Dynamic",
+    "static": "🔒 Static",
+    "regex": "🔄 Regex",
+    "code": "💻 Code",
+    "upload": "📤 Upload",
+    "king_of_the_hill": "👑 King of the Hill"
+}
+
+# Upper point bounds (inclusive) for each difficulty style; above the last is "red"
+_DIFFICULTY_THRESHOLDS = (100, 300, 500)
+_DIFFICULTY_STYLES = ("green", "yellow", "orange", "red")
+
+_CLIPBOARD_COMMANDS = (
+    ('xclip', '-selection', 'clipboard'),
+    ('pbcopy',),
+    ('wl-copy',),
+)
+
+_SORT_KEYS = {
+    "category": attrgetter("category"),
+    "name": attrgetter("name"),
+    "points": attrgetter("value"),
+    "solves": attrgetter("solves")
+}
+
+class Connection(NamedTuple):
+    """Parsed challenge connection details."""
+    type: str
+    host: str
+    port: str
+    command: str
+    icon: str
+    full_url: Optional[str] = None
+    original: Optional[str] = None
+
+
+# Table column specs: (header, add_column kwargs)
+_CHALLENGE_COLUMNS = (
+    ("ID", {"style": "dim", "width": 6}),
+    ("Status", {"width": 6}),
+    ("Name", {"style": "cyan", "min_width": 15}),
+    ("Category", {"style": "blue", "width": 12}),
+    ("Type", {"style": "magenta", "width": 10}),
+    ("Points", {"style": "green", "width": 8}),
+    ("Solves", {"style": "yellow", "width": 6}),
+    ("Attempts", {"style": "red", "width": 10}),
+)
+_SOLVED_BY_COLUMN = ("Solved By", {"style": "green", "width": 15})
+
+_CATEGORY_COLUMNS = (
+    ("Category", {"style": "cyan", "width": 20}),
+    ("Challenges", {"style": "blue", "width": 15}),
+    ("Solved", {"style": "green", "width": 10}),
+    ("Progress", {"style": "yellow", "width": 15}),
+    ("Total Points", {"style": "red", "width": 15}),
+)
+
 
 @app.callback(invoke_without_command=True)
 def main(ctx: typer.Context):
@@ -46,14 +135,23 @@ def get_difficulty_style(points: int) -> str:
     Returns:
         Rich style string
     """
-    if points <= 100:
-        return "green"
-    elif points <= 300:
-        return "yellow"
-    elif points <= 500:
-        return "orange"
-    else:
-        return "red"
+    return _DIFFICULTY_STYLES[bisect_left(_DIFFICULTY_THRESHOLDS, points)]
+
+
+def _build_table(title: str, columns) -> Table:
+    """Create a Rich table from a column spec.
+
+    Args:
+        title: Table title
+        columns: Sequence of (header, add_column kwargs) tuples
+
+    Returns:
+        Table with all columns added
+    """
+    table = Table(title=title, show_header=True, header_style="bold magenta")
+    for header, kwargs in columns:
+        table.add_column(header, **kwargs)
+    return table
 
 
 def format_challenge_status(solved: bool) -> str:
@@ -79,29 +177,8 @@ def format_challenge_type(challenge_type: str, short: bool = False) -> str:
         Formatted type string
     """
     if short:
-        type_short = {
-            "standard": "STD",
-            "multiple_choice": "MC",
-            "dynamic": "DYN",
-            "static": "STC",
-            "regex": "RGX",
-            "code": "CODE",
-            "upload": "UPL",
-            "king_of_the_hill": "KOTH"
-        }
-        return type_short.get(challenge_type, challenge_type.upper()[:4])
-    else:
-        type_full = {
-            "standard": "📝 Standard",
-            "multiple_choice": "☑️ Multiple Choice",
-            "dynamic": "⚡ Dynamic",
-            "static": "🔒 Static",
-            "regex": "🔄 Regex",
-            "code": "💻 Code",
-            "upload": "📤 Upload",
-            "king_of_the_hill": "👑 King of the Hill"
-        }
-        return type_full.get(challenge_type, f"❓ {challenge_type.title()}")
+        return _TYPE_SHORT.get(challenge_type) or challenge_type.upper()[:4]
+    return _TYPE_FULL.get(challenge_type) or f"❓ {challenge_type.title()}"
 
 
 def format_attempts_info(attempts: int, max_attempts: Optional[int]) -> str:
@@ -121,95 +198,90 @@ def format_attempts_info(attempts: int, max_attempts: Optional[int]) -> str:
         return f"[{style}]{attempts}/{max_attempts}[/{style}]"
 
 
-def parse_connection_info(connection_info: str) -> Dict[str, str]:
+@functools.lru_cache(maxsize=1024)
+def parse_connection_info(connection_info: str) -> Optional[Connection]:
     """Parse connection details from CTFd connection_info field.
 
+    Results are memoized; the returned Connection is immutable so it is
+    safe to share between callers.
+
     Args:
         connection_info: Connection info string from CTFd API
 
     Returns:
-        Dictionary with connection details including type, host, port, command, icon
+        Connection with type, host, port, command and icon, or None if empty
     """
     if not connection_info:
         return None
 
-    # Check for HTTP/HTTPS URLs
-    if connection_info.startswith(('http://', 'https://')):
-        import urllib.parse
+    match = _CONNECTION_RE.match(connection_info)
+    kind = match.lastgroup if match else None
+
+    # HTTP/HTTPS URLs
+    if kind == 'url':
         parsed = urllib.parse.urlparse(connection_info)
         port = str(parsed.port) if parsed.port else ('443' if parsed.scheme == 'https' else '80')
 
-        return {
-            'type': 'web',
-            'host': parsed.hostname or parsed.netloc,
-            'port': port,
-            'command': connection_info,
-            'icon': '🌐',
-            'full_url': connection_info
-        }
-
-    # Check for netcat pattern: nc host port
-    nc_match = re.match(r'nc\s+([a-zA-Z0-9.-]+)\s+(\d+)', connection_info)
-    if nc_match:
-        host, port = nc_match.groups()
-        return {
-            'type': 'netcat',
-            'host': host,
-            'port': port,
-            'command': connection_info,
-            'icon': '🔌'
-        }
-
-    # Check for SSH pattern
-    if connection_info.startswith('ssh '):
+        return Connection('web', parsed.hostname or parsed.netloc, port, connection_info, '🌐',
+                          full_url=connection_info)
+
+    # Netcat pattern: nc host port
+    if kind == 'nc_port':
+        return Connection('netcat', match.group('nc_host'), match.group('nc_port'), connection_info, '🔌')
+
+    # SSH pattern
+    if kind == 'ssh':
         ssh_part = connection_info[4:]  # Remove 'ssh ' prefix
         host = ssh_part.split('@')[-1] if '@' in ssh_part else ssh_part
-        return {
-            'type': 'ssh',
-            'host': host,
-            'port': '22',
-            'command': connection_info,
-            'icon': '🔐'
-        }
-
-    # Check for telnet pattern
-    if connection_info.startswith('telnet '):
+        return Connection('ssh', host, '22', connection_info, '🔐')
+
+    # Telnet pattern
+    if kind == 'telnet':
         telnet_parts = connection_info.split()
         if len(telnet_parts) >= 3:
             host, port = telnet_parts[1], telnet_parts[2]
         else:
             host, port = telnet_parts[1] if len(telnet_parts) > 1 else '', '23'
 
-        return {
-            'type': 'telnet',
-            'host': host,
-            'port': port,
-            'command': connection_info,
-            'icon': '📞'
-        }
-
-    # Check for host:port pattern
-    hostport_match = re.match(r'([a-zA-Z0-9.-]+):(\d+)', connection_info)
-    if hostport_match:
-        host, port = hostport_match.groups()
-        return {
-            'type': 'generic',
-            'host': host,
-            'port': port,
-            'command': f'nc {host} {port}',
-            'icon': '🔗',
-            'original': connection_info
-        }
+        return Connection('telnet', host, port, connection_info, '📞')
+
+    # host:port pattern
+    if kind == 'port':
+        host, port = match.group('host', 'port')
+        return Connection('generic', host, port, f'nc {host} {port}', '🔗', original=connection_info)
 
     # If no pattern matches, treat as generic connection info
-    return {
-        'type': 'other',
-        'host': 'N/A',
-        'port': 'N/A',
-        'command': connection_info,
-        'icon': '❓',
-        'original': connection_info
-    }
+    return Connection('other', 'N/A', 'N/A', connection_info, '❓', original=connection_info)
+
+
+def _fetch_member_name(client: CTFdClient, member_id: int) -> Tuple[int, str]:
+    """Fetch a team member's display name.
+
+    Args:
+        client: CTFd client
+        member_id: User ID of the team member
+
+    Returns:
+        Tuple of (member_id, name), falling back to a placeholder on error
+    """
+    try:
+        member_data = client._make_request('GET', f'/users/{member_id}')
+        return member_id, member_data.get('name', f'User {member_id}')
+    except Exception:
+        return member_id, f'User {member_id}'
+
+
+@functools.lru_cache(maxsize=None)
+def _clipboard_command() -> Optional[Tuple[str, ...]]:
+    """Find the first available clipboard utility (resolved once per process).
+
+    Returns:
+        Command to pipe text into, or None if no utility is installed
+    """
+    for command in _CLIPBOARD_COMMANDS:
+        if shutil.which(command[0]):
+            return command
+    return None
 
 
 @app.command("list")
@@ -223,7 +295,7 @@ def list_challenges(
 ):
     """List all available challenges."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -261,40 +333,30 @@ def list_challenges(
         team_members = {}
         try:
             challenge_solvers = client.get_challenge_solvers()
-            # Get team member names
+            # Get team member names concurrently
             team_data = client._make_request('GET', '/teams/me')
-            for member_id in team_data.get('members', []):
-                try:
-                    member_data = client._make_request('GET', f'/users/{member_id}')
-                    team_members[member_id] = member_data.get('name', f'User {member_id}')
-                except Exception:
-                    team_members[member_id] = f'User {member_id}'
+            members = team_data.get('members', [])
+            if members:
+                with ThreadPoolExecutor(max_workers=min(8, len(members))) as executor:
+                    team_members = dict(executor.map(lambda mid: _fetch_member_name(client, mid), members))
         except Exception:
             pass  # Not in team mode or API error
 
-        # Apply filters
-        filtered_challenges = challenges
-
-        if category:
-            filtered_challenges = [c for c in filtered_challenges if c.category.lower() == category.lower()]
-
-        if solved is not None:
-            filtered_challenges = [c for c in filtered_challenges if c.solved_by_me == solved]
+        # Apply filters in a single pass
+        category_lc = category.lower() if category else None
+        filtered_challenges = [
+            c for c in challenges
+            if (category_lc is None or c.category.lower() == category_lc)
+            and (solved is None or c.solved_by_me == solved)
+        ]
 
         if not filtered_challenges:
             console.print("[yellow]No challenges match the specified filters[/yellow]")
             return
 
         # Sort challenges
-        sort_key_map = {
-            "category": lambda c: c.category,
-            "name": lambda c: c.name,
-            "points": lambda c: c.value,
-            "solves": lambda c: c.solves
-        }
-
-        if sort_by in sort_key_map:
-            filtered_challenges.sort(key=sort_key_map[sort_by], reverse=reverse)
+        if sort_by in _SORT_KEYS:
+            filtered_challenges.sort(key=_SORT_KEYS[sort_by], reverse=reverse)
 
         # Display results
         if detailed:
@@ -304,7 +366,7 @@ def list_challenges(
 
         # Show summary
         total_challenges = len(challenges)
-        solved_count = len([c for c in challenges if c.solved_by_me])
+        solved_count = sum(c.solved_by_me for c in challenges)
         displayed_count = len(filtered_challenges)
 
         summary_text = f"Showing {displayed_count} of {total_challenges} challenges"
@@ -318,93 +380,110 @@ def list_challenges(
         raise typer.Exit(1)
 
 
+def _resolve_solver_names(challenge_solvers: Dict[int, List[int]], team_members: Dict[int, str]) -> Dict[int, str]:
+    """Resolve the "solved by" label for every solved challenge once.
+
+    Args:
+        challenge_solvers: Mapping of challenge ID to solver user IDs
+        team_members: Mapping of user ID to name
+
+    Returns:
+        Mapping of challenge ID to comma-separated solver names
+    """
+    names = {}
+    solved_by = {}
+    for challenge_id, solvers in challenge_solvers.items():
+        if not solvers:
+            continue
+        for solver_id in solvers:
+            if solver_id not in names:
+                names[solver_id] = team_members.get(solver_id) or f"User {solver_id}"
+        solved_by[challenge_id] = ", ".join([names[solver_id] for solver_id in solvers])
+    return solved_by
+
+
+def _challenge_row(challenge) -> Tuple[str, ...]:
+    """Format the common table cells for a challenge."""
+    return (
+        str(challenge.id),
+        format_challenge_status(challenge.solved_by_me),
+        challenge.name,
+        challenge.category,
+        format_challenge_type(challenge.type, short=True),
+        f"[{get_difficulty_style(challenge.value)}]{challenge.value}[/]",
+        str(challenge.solves),
+        format_attempts_info(challenge.attempts, challenge.max_attempts)
+    )
+
+
 def _display_challenges_table(challenges, ctf_name="CTF", challenge_solvers=None, team_members=None):
     """Display challenges in a table format."""
-    challenge_solvers = challenge_solvers or {}
-    team_members = team_members or {}
-
-    table = Table(title=f"🚩 {ctf_name} - Challenges", show_header=True, header_style="bold magenta")
-    table.add_column("ID", style="dim", width=6)
-    table.add_column("Status", width=6)
-    table.add_column("Name", style="cyan", min_width=15)
-    table.add_column("Category", style="blue", width=12)
-    table.add_column("Type", style="magenta", width=10)
-    table.add_column("Points", style="green", width=8)
-    table.add_column("Solves", style="yellow", width=6)
-    table.add_column("Attempts", style="red", width=10)
-
-    # Add "Solved By" column if we have team information
     if team_members:
-        table.add_column("Solved By", style="green", width=15)
+        table = _challenges_table_team(challenges, ctf_name, challenge_solvers or {}, team_members)
+    else:
+        table = _challenges_table_solo(challenges, ctf_name)
+    console.print(table)
 
-    for challenge in challenges:
-        status = format_challenge_status(challenge.solved_by_me)
-        points_style = get_difficulty_style(challenge.value)
 
-        # Prepare row data
-        row_data = [
-            str(challenge.id),
-            status,
-            challenge.name,
-            challenge.category,
-            format_challenge_type(challenge.type, short=True),
-            f"[{points_style}]{challenge.value}[/{points_style}]",
-            str(challenge.solves),
-            format_attempts_info(challenge.attempts, challenge.max_attempts)
-        ]
+def _challenges_table_solo(challenges, ctf_name: str) -> Table:
+    """Build the challenges table without team solver information."""
+    table = _build_table(f"🚩 {ctf_name} - Challenges", _CHALLENGE_COLUMNS)
 
-        # Add solver information if available
-        if team_members:
-            solvers = challenge_solvers.get(challenge.id, [])
-            if solvers:
-                solver_names = [team_members.get(solver_id, f"User {solver_id}") for solver_id in solvers]
-                row_data.append(", ".join(solver_names))
-            else:
-                row_data.append("-")
+    # Format all rows up front, then hand them to Rich in bulk
+    rows = [_challenge_row(c) for c in challenges]
+    for row in rows:
+        table.add_row(*row)
 
-        table.add_row(*row_data)
+    return table
 
-    console.print(table)
+
+def _challenges_table_team(challenges, ctf_name: str, challenge_solvers, team_members) -> Table:
+    """Build the challenges table with a "Solved By" column."""
+    table = _build_table(f"🚩 {ctf_name} - Challenges", _CHALLENGE_COLUMNS + (_SOLVED_BY_COLUMN,))
+    solved_by = _resolve_solver_names(challenge_solvers, team_members)
+
+    # Format all rows up front, then hand them to Rich in bulk
+    rows = [_challenge_row(c) + (solved_by.get(c.id, "-"),) for c in challenges]
+    for row in rows:
+        table.add_row(*row)
+
+    return table
 
 
 def _display_detailed_challenges(challenges, ctf_name="CTF", challenge_solvers=None, team_members=None):
     """Display challenges in detailed card format."""
-    challenge_solvers = challenge_solvers or {}
-    team_members = team_members or {}
+    # Solver lines are resolved up front so the card loop needs no team-mode branch
+    solved_by = _resolve_solver_names(challenge_solvers or {}, team_members) if team_members else {}
+    solvers_lines = {cid: f"\nSolved by: [green]{names}[/green]" for cid, names in solved_by.items()}
     cards = []
 
     for challenge in challenges:
         status = format_challenge_status(challenge.solved_by_me)
         points_style = get_difficulty_style(challenge.value)
 
-        # Create challenge card
-        content = []
-        content.append(f"[bold cyan]{challenge.name}[/bold cyan]")
-        content.append(f"Category: [blue]{challenge.category}[/blue]")
-        content.append(f"Type: [magenta]{format_challenge_type(challenge.type)}[/magenta]")
-        content.append(f"Points: [{points_style}]{challenge.value}[/{points_style}]")
-        content.append(f"Solves: [yellow]{challenge.solves}[/yellow]")
-        content.append(f"Attempts: {format_attempts_info(challenge.attempts, challenge.max_attempts)}")
-        content.append(f"Status: {status}")
-
-        if challenge.tags:
-            content.append(f"Tags: {', '.join(challenge.tags)}")
-
-        # Add solver information if available
-        if team_members:
-            solvers = challenge_solvers.get(challenge.id, [])
-            if solvers:
-                solver_names = [team_members.get(solver_id, f"User {solver_id}") for solver_id in solvers]
-                content.append(f"Solved by: [green]{', '.join(solver_names)}[/green]")
+        # Optional rows (tags, solvers)
+        tags_line = f"\nTags: {', '.join(challenge.tags)}" if challenge.tags else ""
+        solvers_line = solvers_lines.get(challenge.id, "")
 
         # Truncate description
         desc = challenge.description
         if len(desc) > 100:
             desc = desc[:100] + "..."
-        content.append(f"\n{desc}")
+
+        # Create challenge card
+        content = (
+            f"[bold cyan]{challenge.name}[/bold cyan]\n"
+            f"Category: [blue]{challenge.category}[/blue]\n"
+            f"Type: [magenta]{format_challenge_type(challenge.type)}[/magenta]\n"
+            f"Points: [{points_style}]{challenge.value}[/{points_style}]\n"
+            f"Solves: [yellow]{challenge.solves}[/yellow]\n"
+            f"Attempts: {format_attempts_info(challenge.attempts, challenge.max_attempts)}\n"
+            f"Status: {status}"
+            f"{tags_line}{solvers_line}\n\n{desc}"
+        )
 
         card = Panel(
-            "\n".join(content),
+            content,
             title=f"ID: {challenge.id}",
             border_style="green" if challenge.solved_by_me else "white"
         )
@@ -421,7 +500,7 @@ def show_challenge(
 ):
     """Show detailed information about a specific challenge."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -439,9 +518,8 @@ def show_challenge(
             console.print("[red]❌ Failed to connect to CTFd[/red]")
             raise typer.Exit(1)
 
-        # Get all challenges to find the specific one
-        challenges = client.get_challenges()
-        challenge = next((c for c in challenges if c.id == challenge_id), None)
+        # Fetch only the requested challenge
+        challenge = client.get_challenge(challenge_id)
 
         if not challenge:
             console.print(f"[red]Challenge with ID {challenge_id} not found[/red]")
@@ -453,46 +531,50 @@ def show_challenge(
         status = "✅ Solved" if challenge.solved_by_me else "❌ Not solved"
         points_style = get_difficulty_style(challenge.value)
 
-        details = []
-        details.append(f"[bold cyan]Name:[/bold cyan] {challenge.name}")
-        details.append(f"[bold cyan]ID:[/bold cyan] {challenge.id}")
-        details.append(f"[bold cyan]Category:[/bold cyan] {challenge.category}")
-        details.append(f"[bold cyan]Type:[/bold cyan] {format_challenge_type(challenge.type)}")
-        details.append(f"[bold cyan]Points:[/bold cyan] [{points_style}]{challenge.value}[/{points_style}]")
-        details.append(f"[bold cyan]Solves:[/bold cyan] {challenge.solves}")
-        details.append(f"[bold cyan]Attempts:[/bold cyan] {format_attempts_info(challenge.attempts, challenge.max_attempts)}")
-        details.append(f"[bold cyan]Status:[/bold cyan] {status}")
+        details = (
+            f"[bold cyan]Name:[/bold cyan] {challenge.name}\n"
+            f"[bold cyan]ID:[/bold cyan] {challenge.id}\n"
+            f"[bold cyan]Category:[/bold cyan] {challenge.category}\n"
+            f"[bold cyan]Type:[/bold cyan] {format_challenge_type(challenge.type)}\n"
+            f"[bold cyan]Points:[/bold cyan] [{points_style}]{challenge.value}[/{points_style}]\n"
+            f"[bold cyan]Solves:[/bold cyan] {challenge.solves}\n"
+            f"[bold cyan]Attempts:[/bold cyan] {format_attempts_info(challenge.attempts, challenge.max_attempts)}\n"
+            f"[bold cyan]Status:[/bold cyan] {status}"
+        )
 
         if challenge.tags:
-            details.append(f"[bold cyan]Tags:[/bold cyan] {', '.join(challenge.tags)}")
+            details += f"\n[bold cyan]Tags:[/bold cyan] {', '.join(challenge.tags)}"
 
         if challenge.max_attempts:
-            details.append(f"[bold cyan]Max Attempts:[/bold cyan] {challenge.max_attempts}")
+            details += f"\n[bold cyan]Max Attempts:[/bold cyan] {challenge.max_attempts}"
 
         # Add connection information if available
         if challenge.connection_info:
             connection = parse_connection_info(challenge.connection_info)
             if connection:
-                details.append(f"\n[bold cyan]Connection:[/bold cyan]")
-                details.append(f"  {connection['icon']} Type: {connection['type'].title()}")
-                details.append(f"  🏠 Host: {connection['host']}")
-                details.append(f"  🔌 Port: {connection['port']}")
-                details.append(f"  💻 Command: [cyan]{connection['command']}[/cyan]")
+                details += (
+                    f"\n\n[bold cyan]Connection:[/bold cyan]\n"
+                    f"  {connection.icon} Type: {connection.type.title()}\n"
+                    f"  🏠 Host: {connection.host}\n"
+                    f"  🔌 Port: {connection.port}\n"
+                    f"  💻 Command: [cyan]{connection.command}[/cyan]"
+                )
 
-        details.append(f"\n[bold cyan]Description:[/bold cyan]\n{challenge.description}")
+        details += f"\n\n[bold cyan]Description:[/bold cyan]\n{challenge.description}"
 
         if challenge.files:
-            details.append(f"\n[bold cyan]Files:[/bold cyan]")
-            for file in challenge.files:
-                details.append(f"  • {file}")
+            details += "\n\n[bold cyan]Files:[/bold cyan]"
+            details += "".join(f"\n  • {file}" for file in challenge.files)
 
         if challenge.hints:
-            details.append(f"\n[bold cyan]Hints:[/bold cyan]")
-            for i, hint in enumerate(challenge.hints, 1):
-                details.append(f"  {i}. {hint.get('content', 'No content')}")
+            details += "\n\n[bold cyan]Hints:[/bold cyan]"
+            details += "".join(
+                f"\n  {i}. {hint.get('content', 'No content')}"
+                for i, hint in enumerate(challenge.hints, 1)
+            )
 
         panel = Panel(
-            "\n".join(details),
+            details,
             title=f"🚩 Challenge Details",
             border_style="green" if challenge.solved_by_me else "cyan",
             padding=(1, 2)
@@ -548,7 +630,7 @@ def list_categories(
 ):
     """List all available categories."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -572,30 +654,18 @@ def list_categories(
             console.print("[yellow]No challenges found[/yellow]")
             return
 
-        # Group by category
-        categories = {}
+        # Group by category: [total, solved, points]
+        categories = defaultdict(lambda: [0, 0, 0])
         for challenge in challenges:
-            category = challenge.category
-            if category not in categories:
-                categories[category] = {"total": 0, "solved": 0, "points": 0}
-
-            categories[category]["total"] += 1
-            categories[category]["points"] += challenge.value
-
-            if challenge.solved_by_me:
-                categories[category]["solved"] += 1
+            stats = categories[challenge.category]
+            stats[0] += 1
+            stats[1] += challenge.solved_by_me
+            stats[2] += challenge.value
 
         # Display categories table
-        table = Table(title="📂 Challenge Categories", show_header=True, header_style="bold magenta")
-        table.add_column("Category", style="cyan", width=20)
-        table.add_column("Challenges", style="blue", width=15)
-        table.add_column("Solved", style="green", width=10)
-        table.add_column("Progress", style="yellow", width=15)
-        table.add_column("Total Points", style="red", width=15)
-
-        for category, stats in sorted(categories.items()):
-            solved = stats["solved"]
-            total = stats["total"]
+        table = _build_table("📂 Challenge Categories", _CATEGORY_COLUMNS)
+
+        for category, (total, solved, points) in sorted(categories.items()):
             progress = f"{solved}/{total} ({solved/total*100:.1f}%)"
 
             table.add_row(
@@ -603,7 +673,7 @@ def list_categories(
                 str(total),
                 str(solved),
                 progress,
-                str(stats["points"])
+                str(points)
             )
 
         console.print(table)
@@ -623,7 +693,7 @@ def list_connections(
 ):
     """Extract and display connection details from challenge descriptions."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -648,23 +718,24 @@ def list_connections(
             return
 
         # Filter challenges
-        filtered_challenges = challenges
-
-        if challenge_id is not None:
-            filtered_challenges = [c for c in filtered_challenges if c.id == challenge_id]
-            if not filtered_challenges:
-                console.print(f"[red]Challenge with ID {challenge_id} not found[/red]")
-                raise typer.Exit(1)
-
-        if category:
-            filtered_challenges = [c for c in filtered_challenges if c.category.lower() == category.lower()]
+        if challenge_id is not None and not any(c.id == challenge_id for c in challenges):
+            console.print(f"[red]Challenge with ID {challenge_id} not found[/red]")
+            raise typer.Exit(1)
 
-        if solved is not None:
-            filtered_challenges = [c for c in filtered_challenges if c.solved_by_me == solved]
+        category_lc = category.lower() if category else None
+        filtered_challenges = [
+            c for c in challenges
+            if (challenge_id is None or c.id == challenge_id)
+            and (category_lc is None or c.category.lower() == category_lc)
+            and (solved is None or c.solved_by_me == solved)
+        ]
 
         # Extract connections from all filtered challenges
+        # and collect summary statistics in the same pass
         challenge_connections = {}
-        all_connections = []
+        total_connections = 0
+        hosts = set()
+        connection_types = set()
 
         for challenge in filtered_challenges:
             if challenge.connection_info:
@@ -674,9 +745,11 @@ def list_connections(
                         'challenge': challenge,
                         'connection': connection
                     }
-                    all_connections.append(connection)
+                    total_connections += 1
+                    hosts.add(connection.host)
+                    connection_types.add(connection.type)
 
-        if not all_connections:
+        if not total_connections:
             console.print("[yellow]No connection details found in challenges[/yellow]")
             return
 
@@ -700,10 +773,10 @@ def list_connections(
             # Create a panel for each connection
             connection_info = []
             connection_info.append(f"[bold cyan]Challenge:[/bold cyan] {challenge.name} {status_emoji}")
-            connection_info.append(f"[bold blue]Type:[/bold blue] {connection['icon']} {connection['type'].title()}")
-            connection_info.append(f"[bold green]Host:[/bold green] {connection['host']}")
-            connection_info.append(f"[bold yellow]Port:[/bold yellow] {connection['port']}")
-            connection_info.append(f"[bold white]Command:[/bold white] [cyan]{connection['command']}[/cyan]")
+            connection_info.append(f"[bold blue]Type:[/bold blue] {connection.icon} {connection.type.title()}")
+            connection_info.append(f"[bold green]Host:[/bold green] {connection.host}")
+            connection_info.append(f"[bold yellow]Port:[/bold yellow] {connection.port}")
+            connection_info.append(f"[bold white]Command:[/bold white] [cyan]{connection.command}[/cyan]")
 
             panel = Panel(
                 "\n".join(connection_info),
@@ -714,14 +787,10 @@ def list_connections(
 
             # Store first command for copying
             if first_command is None:
-                first_command = connection['command']
+                first_command = connection.command
 
         # Show summary
-        total_connections = len(all_connections)
-        unique_hosts = len(set(conn['host'] for conn in all_connections))
-        connection_types = set(conn['type'] for conn in all_connections)
-
-        summary_text = f"Found {total_connections} connections across {unique_hosts} unique hosts"
+        summary_text = f"Found {total_connections} connections across {len(hosts)} unique hosts"
         summary_text += f" | Types: {', '.join(sorted(connection_types))}"
 
         console.print(f"\n[cyan]{summary_text}[/cyan]")
@@ -729,18 +798,9 @@ def list_connections(
         # Copy to clipboard if requested
         if copy and first_command:
             try:
-                import subprocess
-                import shutil
-
-                # Try different clipboard commands
-                if shutil.which('xclip'):
-                    subprocess.run(['xclip', '-selection', 'clipboard'], input=first_command.encode(), check=True)
-                    console.print(f"[green]✅ Copied to clipboard: {first_command}[/green]")
-                elif shutil.which('pbcopy'):
-                    subprocess.run(['pbcopy'], input=first_command.encode(), check=True)
-                    console.print(f"[green]✅ Copied to clipboard: {first_command}[/green]")
-                elif shutil.which('wl-copy'):
-                    subprocess.run(['wl-copy'], input=first_command.encode(), check=True)
+                clipboard_cmd = _clipboard_command()
+                if clipboard_cmd:
+                    subprocess.run(clipboard_cmd, input=first_command.encode(), check=True)
                     console.print(f"[green]✅ Copied to clipboard: {first_command}[/green]")
                 else:
                     console.print("[yellow]⚠️ No clipboard utility found (xclip, pbcopy, or wl-copy)[/yellow]")
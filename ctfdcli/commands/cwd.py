@@ -1,5 +1,6 @@
 """CWD (Current Working Directory) commands for challenge operations."""
 
+import mmap
 import os
 import re
 from pathlib import Path
@@ -7,65 +8,123 @@ from typing import Optional, Tuple
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 from rich.prompt import Confirm
 
-from ..core import ConfigManager, CTFdClient
+from ..core import get_config_manager, CTFdClient, CTFdAPIError, CTFdConnectionError
 from ..utils import show_subcommands
 
 app = typer.Typer(help="Operations within challenge directories")
 console = Console()
 
+# Byte patterns so README.md can be searched in place without decoding it
+_CHALLENGE_ID_KEY = b'Challenge ID'
+_TITLE_RE = re.compile(rb'^# (.+)', re.MULTILINE)
+
+# README status line written by sync, with or without the leading emoji
+_UNSOLVED_MARKER = b'**Status:** UNSOLVED'
+_STATUS_RE = re.compile(r'(❌ )?\*\*Status:\*\* UNSOLVED'.encode('utf-8'))
+
+
+def _solved_status(match: re.Match) -> bytes:
+    """Replacement for _STATUS_RE that keeps the emoji only if it was present."""
+    return '✅ **Status:** SOLVED'.encode('utf-8') if match.group(1) else b'**Status:** SOLVED'
 
-def find_challenge_info() -> Tuple[Optional[int], Optional[str], Optional[str]]:
-    """Find challenge information from current directory structure.
+
+def _extract_challenge_id(content) -> Optional[int]:
+    """Find the backtick-quoted ID following "Challenge ID" on the same line.
+
+    Uses plain substring searches rather than a regex, e.g. for the synced
+    README row ``| Challenge ID | `42` |``.
+
+    Args:
+        content: README contents as bytes or an mmap
 
     Returns:
-        Tuple of (challenge_id, challenge_name, category) or (None, None, None)
+        Challenge ID or None if not present
     """
-    cwd = Path.cwd()
+    key = content.find(_CHALLENGE_ID_KEY)
+    while key >= 0:
+        line_end = content.find(b'\n', key)
+        if line_end < 0:
+            line_end = len(content)
+        tick1 = content.find(b'`', key, line_end)
+        tick2 = content.find(b'`', tick1 + 1, line_end) if tick1 >= 0 else -1
+        if tick2 >= 0:
+            value = content[tick1 + 1:tick2]
+            if value.isdigit():
+                return int(value)
+        key = content.find(_CHALLENGE_ID_KEY, key + len(_CHALLENGE_ID_KEY))
+    return None
 
-    # Look for README.md with challenge ID
-    readme_path = cwd / "README.md"
-    if readme_path.exists():
-        try:
-            content = readme_path.read_text(encoding='utf-8')
 
-            # Extract challenge ID from README
-            id_match = re.search(r'Challenge ID.*?`(\d+)`', content)
-            if id_match:
-                challenge_id = int(id_match.group(1))
+def _read_readme_info(readme_path: Path) -> Tuple[Optional[int], Optional[str]]:
+    """Extract challenge ID and title from a synced README.md.
 
-                # Get challenge name from title
-                title_match = re.search(r'^# (.+)', content, re.MULTILINE)
-                challenge_name = title_match.group(1) if title_match else None
+    The file is memory-mapped and searched as bytes; only the matched
+    groups are decoded.
 
-                # Try to determine category from directory structure
-                category = None
-                if cwd.parent.name != "challenges":  # Not in root challenges dir
-                    category = cwd.parent.name.replace('_', '/')
+    Args:
+        readme_path: Path to README.md
 
-                return challenge_id, challenge_name, category
+    Returns:
+        Tuple of (challenge_id, challenge_name); challenge_id is None if
+        the file is missing or has no Challenge ID
+    """
+    try:
+        with open(readme_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            challenge_id = _extract_challenge_id(content)
+            if challenge_id is None:
+                return None, None
+
+            # Get challenge name from title
+            title_match = _TITLE_RE.search(content)
+            challenge_name = None
+            if title_match:
+                challenge_name = title_match.group(1).decode('utf-8', errors='replace').rstrip('\r')
+            return challenge_id, challenge_name
+    except (OSError, ValueError):
+        # Missing/unreadable file, or an empty file that cannot be mapped
+        return None, None
+
+
+def find_challenge_info(cwd: Path) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+    """Find challenge information from current directory structure.
+
+    Args:
+        cwd: Current working directory
+
+    Returns:
+        Tuple of (challenge_id, challenge_name, category) or (None, None, None)
+    """
+
+    # Look for README.md with challenge ID
+    challenge_id, challenge_name = _read_readme_info(cwd / "README.md")
+    if challenge_id is not None:
+        # Try to determine category from directory structure
+        category = None
+        if cwd.parent.name != "challenges":  # Not in root challenges dir
+            category = cwd.parent.name.replace('_', '/')
 
-        except Exception:
-            pass
+        return challenge_id, challenge_name, category
 
     # Fallback: try to infer from directory structure
     # Expected structure: challenges/category/challenge_name/
     parts = cwd.parts
-    if len(parts) >= 3 and "challenges" in parts:
-        # Find the challenges directory in the path
-        try:
-            challenges_idx = list(parts).index("challenges")
-            if challenges_idx + 2 < len(parts):  # We have category and challenge
-                category = parts[challenges_idx + 1].replace('_', '/')
-                challenge_name = parts[challenges_idx + 2]
-                return None, challenge_name, category
-            elif challenges_idx + 1 < len(parts):  # We only have challenge (no category)
-                challenge_name = parts[challenges_idx + 1]
-                return None, challenge_name, None
-        except ValueError:
-            pass
+    if len(parts) >= 3:
+        # Find the innermost challenges directory in the path
+        challenges_idx = -1
+        for i in range(len(parts) - 1, -1, -1):
+            if parts[i] == "challenges":
+                challenges_idx = i
+                break
+
+        if challenges_idx >= 0:
+            rest = parts[challenges_idx + 1:challenges_idx + 3]
+            if len(rest) == 2:  # We have category and challenge
+                return None, rest[1], rest[0].replace('_', '/')
+            elif rest:  # We only have challenge (no category)
+                return None, rest[0], None
 
     # Final fallback: current directory name as challenge
     if len(parts) >= 1:
@@ -75,21 +134,17 @@ def find_challenge_info() -> Tuple[Optional[int], Optional[str], Optional[str]]:
     return None, None, None
 
 
-def get_flag_from_file() -> Optional[str]:
-    """Get flag content from flag.txt file."""
-    flag_path = Path.cwd() / "flag.txt"
-    if not flag_path.exists():
-        return None
+def get_flag_from_file(cwd: Path) -> Optional[str]:
+    """Get flag content from flag.txt file in the given directory."""
+    flag_path = cwd / "flag.txt"
 
     try:
-        content = flag_path.read_text(encoding='utf-8').strip()
-
-        # Remove comments and empty lines
-        lines = [line.strip() for line in content.split('\n')
-                if line.strip() and not line.strip().startswith('#')]
-
-        if lines:
-            return lines[0]  # Return first non-comment line
+        with open(flag_path, 'r', encoding='utf-8') as f:
+            # Return first non-comment, non-empty line without reading the rest
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    return line
 
     except Exception:
         pass
@@ -120,45 +175,39 @@ def challenge_info(
 ):
     """Display information about the current challenge directory."""
 
-    challenge_id, challenge_name, category = find_challenge_info()
+    cwd = Path.cwd()
+    challenge_id, challenge_name, category = find_challenge_info(cwd)
 
     if not challenge_id and not challenge_name:
         console.print("[red]❌ Not in a challenge directory or unable to detect challenge info[/red]")
         console.print("[yellow]💡 Make sure you're in a directory synced with 'ctfdcli sync'[/yellow]")
         raise typer.Exit(1)
 
+    # Check for local files (DirEntry.is_file reuses the cached dirent type)
+    with os.scandir(cwd) as entries:
+        files = sorted(entry.name for entry in entries if entry.is_file())
+
+    # Check flag.txt content
+    flag_content = get_flag_from_file(cwd)
+    if flag_content:
+        flag_line = f"[cyan]🏴 Flag Ready:[/cyan] {flag_content[:20]}..." if len(flag_content) > 20 else f"[cyan]🏴 Flag Ready:[/cyan] {flag_content}"
+    else:
+        flag_line = "[yellow]🏴 Flag:[/yellow] No flag in flag.txt"
+
     # Display local directory info
-    cwd = Path.cwd()
+    optional_lines = (
+        f"[cyan]🎯 Challenge:[/cyan] {challenge_name}" if challenge_name else None,
+        f"[cyan]🏷️ Category:[/cyan] {category}" if category else None,
+        f"[cyan]🆔 Challenge ID:[/cyan] {challenge_id}" if challenge_id else None,
+        f"[cyan]📁 Local Files:[/cyan] {', '.join(files)}" if files else None,
+    )
     info_lines = [
         f"[cyan]📂 Current Directory:[/cyan] {cwd.name}",
         f"[cyan]📍 Full Path:[/cyan] {cwd}",
+        *(line for line in optional_lines if line is not None),
+        flag_line,
     ]
 
-    if challenge_name:
-        info_lines.append(f"[cyan]🎯 Challenge:[/cyan] {challenge_name}")
-
-    if category:
-        info_lines.append(f"[cyan]🏷️ Category:[/cyan] {category}")
-
-    if challenge_id:
-        info_lines.append(f"[cyan]🆔 Challenge ID:[/cyan] {challenge_id}")
-
-    # Check for local files
-    files = []
-    for file_path in cwd.iterdir():
-        if file_path.is_file():
-            files.append(file_path.name)
-
-    if files:
-        info_lines.append(f"[cyan]📁 Local Files:[/cyan] {', '.join(sorted(files))}")
-
-    # Check flag.txt content
-    flag_content = get_flag_from_file()
-    if flag_content:
-        info_lines.append(f"[cyan]🏴 Flag Ready:[/cyan] {flag_content[:20]}..." if len(flag_content) > 20 else f"[cyan]🏴 Flag Ready:[/cyan] {flag_content}")
-    else:
-        info_lines.append("[yellow]🏴 Flag:[/yellow] No flag in flag.txt")
-
     directory_panel = Panel(
         "\n".join(info_lines),
         title="📂 Challenge Directory Info",
@@ -169,7 +218,7 @@ def challenge_info(
 
     # Get remote challenge info if we have challenge ID
     if challenge_id:
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
         profile_obj = config_manager.get_profile(profile)
 
         if profile_obj:
@@ -177,55 +226,51 @@ def challenge_info(
             client = CTFdClient(str(profile_obj.url), profile_obj.token)
 
             try:
-                if client.test_connection():
-                    challenges = client.get_challenges()
-                    challenge = next((c for c in challenges if c.id == challenge_id), None)
-
-                    if challenge:
-                        # Display remote challenge info
-                        status_emoji = "✅" if challenge.solved_by_me else "❌"
-                        status_text = "SOLVED" if challenge.solved_by_me else "UNSOLVED"
-
-                        attempts_info = f"{challenge.attempts}"
-                        if challenge.max_attempts:
-                            attempts_info += f"/{challenge.max_attempts}"
-                            if challenge.attempts >= challenge.max_attempts:
-                                attempts_info += " ⚠️ LIMIT REACHED"
-                        else:
-                            attempts_info += "/∞"
-
-                        remote_info = [
-                            f"[cyan]Status:[/cyan] {status_emoji} {status_text}",
-                            f"[cyan]Points:[/cyan] {challenge.value}",
-                            f"[cyan]Solves:[/cyan] {challenge.solves}",
-                            f"[cyan]Attempts:[/cyan] {attempts_info}",
-                            f"[cyan]Type:[/cyan] {challenge.type or 'standard'}",
-                        ]
-
-                        remote_panel = Panel(
-                            "\n".join(remote_info),
-                            title="🌐 Remote Challenge Status",
-                            border_style="green" if challenge.solved_by_me else "yellow",
-                            padding=(1, 2)
-                        )
-                        console.print(remote_panel)
-
-                        # Show submission warning if attempts are limited
-                        if challenge.max_attempts and not challenge.solved_by_me:
-                            remaining = challenge.max_attempts - challenge.attempts
-                            if remaining <= 3:
-                                warning_panel = Panel(
-                                    f"⚠️ [bold red]WARNING:[/bold red] Only {remaining} attempts remaining!\n"
-                                    f"Use [cyan]ctfdcli cwd submit --confirm[/cyan] for manual confirmation",
-                                    title="⚠️ Limited Attempts",
-                                    border_style="red",
-                                    padding=(1, 2)
-                                )
-                                console.print(warning_panel)
+                challenge = client.get_challenge(challenge_id)
+
+                if challenge:
+                    # Display remote challenge info
+                    status_emoji = "✅" if challenge.solved_by_me else "❌"
+                    status_text = "SOLVED" if challenge.solved_by_me else "UNSOLVED"
+
+                    attempts_info = f"{challenge.attempts}"
+                    if challenge.max_attempts:
+                        attempts_info += f"/{challenge.max_attempts}"
+                        if challenge.attempts >= challenge.max_attempts:
+                            attempts_info += " ⚠️ LIMIT REACHED"
                     else:
-                        console.print(f"[yellow]Challenge ID {challenge_id} not found remotely[/yellow]")
+                        attempts_info += "/∞"
+
+                    remote_info = [
+                        f"[cyan]Status:[/cyan] {status_emoji} {status_text}",
+                        f"[cyan]Points:[/cyan] {challenge.value}",
+                        f"[cyan]Solves:[/cyan] {challenge.solves}",
+                        f"[cyan]Attempts:[/cyan] {attempts_info}",
+                        f"[cyan]Type:[/cyan] {challenge.type or 'standard'}",
+                    ]
+
+                    remote_panel = Panel(
+                        "\n".join(remote_info),
+                        title="🌐 Remote Challenge Status",
+                        border_style="green" if challenge.solved_by_me else "yellow",
+                        padding=(1, 2)
+                    )
+                    console.print(remote_panel)
+
+                    # Show submission warning if attempts are limited
+                    if challenge.max_attempts and not challenge.solved_by_me:
+                        remaining = challenge.max_attempts - challenge.attempts
+                        if remaining <= 3:
+                            warning_panel = Panel(
+                                f"⚠️ [bold red]WARNING:[/bold red] Only {remaining} attempts remaining!\n"
+                                f"Use [cyan]ctfdcli cwd submit --confirm[/cyan] for manual confirmation",
+                                title="⚠️ Limited Attempts",
+                                border_style="red",
+                                padding=(1, 2)
+                            )
+                            console.print(warning_panel)
                 else:
-                    console.print("[yellow]Could not connect to remote CTFd instance[/yellow]")
+                    console.print(f"[yellow]Challenge ID {challenge_id} not found remotely[/yellow]")
             except Exception as e:
                 console.print(f"[yellow]Could not fetch remote info: {e}[/yellow]")
         else:
@@ -241,7 +286,8 @@ def submit_flag(
 ):
     """Submit flag from current challenge directory."""
 
-    challenge_id, challenge_name, category = find_challenge_info()
+    cwd = Path.cwd()
+    challenge_id, challenge_name, category = find_challenge_info(cwd)
 
     if not challenge_id:
         console.print("[red]❌ Cannot determine challenge ID from current directory[/red]")
@@ -253,7 +299,7 @@ def submit_flag(
         flag_to_submit = flag
         flag_source = "command line argument"
     else:
-        flag_to_submit = get_flag_from_file()
+        flag_to_submit = get_flag_from_file(cwd)
         flag_source = "flag.txt"
 
         if not flag_to_submit:
@@ -261,8 +307,26 @@ def submit_flag(
             console.print("[yellow]💡 Add your flag to flag.txt or use --flag option[/yellow]")
             raise typer.Exit(1)
 
+    # Dry run mode: show what would be submitted from local data only
+    if dry_run:
+        dry_run_info = [
+            f"[cyan]Challenge:[/cyan] {challenge_name or 'Unknown'}",
+            f"[cyan]Challenge ID:[/cyan] {challenge_id}",
+            f"[cyan]Category:[/cyan] {category or 'Unknown'}",
+            f"[cyan]Flag Source:[/cyan] {flag_source}",
+            f"[cyan]Flag:[/cyan] {flag_to_submit}",
+        ]
+        console.print(Panel(
+            "\n".join(dry_run_info),
+            title="🚀 Flag Submission (local info only)",
+            border_style="yellow",
+            padding=(1, 2)
+        ))
+        console.print("[blue]🔍 DRY RUN - No flag submitted[/blue]")
+        return
+
     # Get profile and client
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -275,13 +339,16 @@ def submit_flag(
     client = CTFdClient(str(profile_obj.url), profile_obj.token)
 
     try:
-        if not client.test_connection():
+        # Get challenge info to check attempts; this is also the first request,
+        # so it doubles as the connection check
+        try:
+            challenge = client.get_challenge(challenge_id)
+        except CTFdConnectionError:
             console.print("[red]❌ Failed to connect to CTFd[/red]")
             raise typer.Exit(1)
-
-        # Get challenge info to check attempts
-        challenges = client.get_challenges()
-        challenge = next((c for c in challenges if c.id == challenge_id), None)
+        except CTFdAPIError as e:
+            console.print(f"[red]❌ Failed to fetch challenge: {e}[/red]")
+            raise typer.Exit(1)
 
         if not challenge:
             console.print(f"[red]❌ Challenge ID {challenge_id} not found[/red]")
@@ -322,11 +389,6 @@ def submit_flag(
         )
         console.print(submission_panel)
 
-        # Dry run mode
-        if dry_run:
-            console.print("[blue]🔍 DRY RUN - No flag submitted[/blue]")
-            return
-
         # Confirmation check
         should_submit = True
 
@@ -348,30 +410,36 @@ def submit_flag(
             console.print(f"[green]✅ {message}[/green]")
 
             # Update local files on success
-            flag_path = Path.cwd() / "flag.txt"
+            flag_path = cwd / "flag.txt"
             if flag_path.exists() and flag_source == "flag.txt":
                 # Add solved marker to flag.txt
                 with open(flag_path, 'w', encoding='utf-8') as f:
                     f.write(f"# SOLVED! ✅\n{flag_to_submit}\n")
 
             # Update README if exists
-            readme_path = Path.cwd() / "README.md"
-            if readme_path.exists():
-                try:
-                    content = readme_path.read_text(encoding='utf-8')
-                    # Update status in README
-                    content = content.replace("❌ **Status:** UNSOLVED", "✅ **Status:** SOLVED")
-                    content = content.replace("**Status:** UNSOLVED", "**Status:** SOLVED")
-                    readme_path.write_text(content, encoding='utf-8')
-                except Exception:
-                    pass  # Ignore README update failures
+            readme_path = cwd / "README.md"
+            try:
+                with open(readme_path, 'r+b') as f:
+                    content = f.read()
+                    # Update status in README, rewriting only if it changes
+                    if _UNSOLVED_MARKER in content:
+                        f.seek(0)
+                        f.write(_STATUS_RE.sub(_solved_status, content))
+                        f.truncate()
+            except Exception:
+                pass  # Ignore missing README or update failures
 
         else:
             # Show rejection panel similar to main submit command
+            failure_info = [
+                f"[bold red]❌ Incorrect flag for '{challenge.name}'[/bold red]",
+                "",
+                f"Message: {message}",
+                "",
+                "[yellow]💡 Tip: Double-check your flag format and try again![/yellow]",
+            ]
             failure_panel = Panel(
-                f"[bold red]❌ Incorrect flag for '{challenge.name}'[/bold red]\n\n"
-                f"Message: {message}\n\n"
-                f"[yellow]💡 Tip: Double-check your flag format and try again![/yellow]",
+                "\n".join(failure_info),
                 title="❌ Flag Rejected",
                 border_style="red",
                 padding=(1, 2)
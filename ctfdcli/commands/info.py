@@ -1,5 +1,6 @@
 """CTF information display commands."""
 
+import re
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -9,11 +10,26 @@ from rich.text import Text
 from datetime import datetime
 from typing import Optional
 
-from ..core import ConfigManager, CTFdClient
+from ..core import get_config_manager, CTFdClient
 
 app = typer.Typer(help="Display CTF information")
 console = Console()
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _format_timestamp(dt: datetime, timespec: str = 'seconds') -> str:
+    """Format a CTF timestamp as 'YYYY-MM-DD HH:MM[:SS] UTC'.
+
+    Args:
+        dt: Timestamp to format
+        timespec: Precision passed to datetime.isoformat
+
+    Returns:
+        Formatted timestamp string
+    """
+    return f"{dt.replace(tzinfo=None).isoformat(' ', timespec)} UTC"
+
 
 @app.callback(invoke_without_command=True)
 def main(
@@ -25,7 +41,7 @@ def main(
     if ctx.invoked_subcommand is not None:
         return
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -93,15 +109,15 @@ def _display_ctf_info(ctf_info, url: str, client=None):
 
     if ctf_info.start:
         status = "🟢 Started" if ctf_info.start <= now else "🔵 Upcoming"
-        timeline_info.append(f"[bold cyan]Start:[/bold cyan] {ctf_info.start.strftime('%Y-%m-%d %H:%M:%S UTC')} {status}")
+        timeline_info.append(f"[bold cyan]Start:[/bold cyan] {_format_timestamp(ctf_info.start)} {status}")
 
     if ctf_info.end:
         status = "🔴 Ended" if ctf_info.end <= now else "🟡 Ongoing" if ctf_info.start and ctf_info.start <= now else "⚪ Upcoming"
-        timeline_info.append(f"[bold cyan]End:[/bold cyan] {ctf_info.end.strftime('%Y-%m-%d %H:%M:%S UTC')} {status}")
+        timeline_info.append(f"[bold cyan]End:[/bold cyan] {_format_timestamp(ctf_info.end)} {status}")
 
     if ctf_info.freeze:
         status = "🥶 Frozen" if ctf_info.freeze <= now else "❄️ Freeze Pending"
-        timeline_info.append(f"[bold cyan]Freeze:[/bold cyan] {ctf_info.freeze.strftime('%Y-%m-%d %H:%M:%S UTC')} {status}")
+        timeline_info.append(f"[bold cyan]Freeze:[/bold cyan] {_format_timestamp(ctf_info.freeze)} {status}")
 
     if not timeline_info:
         timeline_info.append("[yellow]No timeline information available[/yellow]")
@@ -144,8 +160,7 @@ def _display_ctf_info(ctf_info, url: str, client=None):
     # Rules Panel (full width if available)
     if ctf_info.rules:
         # Clean up HTML tags from rules if present
-        import re
-        clean_rules = re.sub(r'<[^>]+>', '', ctf_info.rules)
+        clean_rules = _HTML_TAG_RE.sub('', ctf_info.rules)
         clean_rules = clean_rules.strip()
 
         if clean_rules:
@@ -161,18 +176,26 @@ def _display_ctf_info(ctf_info, url: str, client=None):
     try:
         # Get additional statistics
         challenges = client.get_challenges()
-        scoreboard = client.get_scoreboard(10)
+        scoreboard = client.get_scoreboard(None)
+
+        # Count challenges, categories and solves in a single pass
+        total = 0
+        solved_count = 0
+        categories = set()
+        for c in challenges:
+            total += 1
+            categories.add(c.category)
+            if c.solved_by_me:
+                solved_count += 1
 
         stats_info = []
-        stats_info.append(f"[bold cyan]Total Challenges:[/bold cyan] {len(challenges)}")
+        stats_info.append(f"[bold cyan]Total Challenges:[/bold cyan] {total}")
 
-        if challenges:
-            categories = set(c.category for c in challenges)
+        if total:
             stats_info.append(f"[bold cyan]Categories:[/bold cyan] {len(categories)}")
 
-            solved = [c for c in challenges if c.solved_by_me]
-            if solved:
-                stats_info.append(f"[bold cyan]Your Solved:[/bold cyan] {len(solved)}/{len(challenges)} ({len(solved)/len(challenges)*100:.1f}%)")
+            if solved_count:
+                stats_info.append(f"[bold cyan]Your Solved:[/bold cyan] {solved_count}/{total} ({solved_count/total*100:.1f}%)")
 
         if scoreboard:
             stats_info.append(f"[bold cyan]Total Participants:[/bold cyan] {len(scoreboard)}")
@@ -199,7 +222,7 @@ def summary_info(
 ):
     """Display a compact summary of CTF information."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -228,9 +251,9 @@ def summary_info(
         table.add_row("Mode", "👥 Teams" if ctf_info.mode == "teams" else "👤 Individual")
 
         if ctf_info.start:
-            table.add_row("Start", ctf_info.start.strftime('%Y-%m-%d %H:%M UTC'))
+            table.add_row("Start", _format_timestamp(ctf_info.start, 'minutes'))
         if ctf_info.end:
-            table.add_row("End", ctf_info.end.strftime('%Y-%m-%d %H:%M UTC'))
+            table.add_row("End", _format_timestamp(ctf_info.end, 'minutes'))
 
         table.add_row("Registration", "✅ Open" if ctf_info.registration else "❌ Closed")
         table.add_row("Status", "🛑 Paused" if ctf_info.paused else "▶️ Active")
@@ -6,7 +6,7 @@ from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.text import Text
 
-from ..core import ConfigManager, CTFdClient
+from ..core import get_config_manager, CTFdClient
 
 app = typer.Typer(help="Initialize CTF profile configuration")
 console = Console()
@@ -27,7 +27,7 @@ def main(
     if ctx.invoked_subcommand is not None:
         return
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
 
     # Welcome banner
     banner = Text("🚩 CTFd CLI Profile Setup", style="bold cyan")
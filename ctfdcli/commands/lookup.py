@@ -4,12 +4,28 @@ import typer
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.columns import Columns
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Optional
 
-from ..core import ConfigManager, CTFdClient
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    def parse_datetime(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp with the standard library."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+from ..core import get_config_manager, CTFdClient, CTFdConnectionError
 from ..utils import show_subcommands
 
+# Optional profile fields shown in the info panels, as (key, label)
+_TEAM_INFO_FIELDS = (
+    ('affiliation', 'Affiliation'),
+    ('website', 'Website'),
+    ('country', 'Country'),
+)
+_USER_INFO_FIELDS = _TEAM_INFO_FIELDS + (('email', 'Email'),)
+
 app = typer.Typer(help="Lookup information about remote teams and users")
 console = Console()
 
@@ -35,11 +51,12 @@ def main(ctx: typer.Context):
 def lookup_team(
     team_identifier: str = typer.Argument(..., help="Team ID or team name to lookup"),
     profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
-    detailed: bool = typer.Option(False, "--detailed", "-d", help="Show detailed information including solves")
+    detailed: bool = typer.Option(False, "--detailed", "-d", help="Look up each member's name and score"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached challenge data")
 ):
     """Lookup information about a remote team by ID or name."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -54,19 +71,12 @@ def lookup_team(
     client = CTFdClient(str(profile_obj.url), profile_obj.token)
 
     try:
-        if not client.test_connection():
-            console.print("[red]❌ Failed to connect to CTFd[/red]")
-            raise typer.Exit(1)
-
-        team_data = None
-
-        # Try to lookup by ID first (if it's a number)
+        # Numeric identifiers are IDs; a miss there is final rather than
+        # falling through to a name search that could match someone else
         if team_identifier.isdigit():
-            team_id = int(team_identifier)
-            team_data = client.get_team_info(team_id)
-
-        # If not found or not a number, search by name
-        if not team_data:
+            team_data = client.get_team_info(int(team_identifier))
+        else:
+            # Otherwise search by name
             teams = client.search_teams(team_identifier)
             if teams:
                 if len(teams) == 1:
@@ -83,8 +93,11 @@ def lookup_team(
             raise typer.Exit(1)
 
         # Display team information
-        _display_team_info(team_data, client, detailed)
+        _display_team_info(team_data, client, detailed, refresh)
 
+    except CTFdConnectionError:
+        console.print("[red]❌ Failed to connect to CTFd[/red]")
+        raise typer.Exit(1)
     except Exception as e:
         console.print(f"[red]❌ Failed to lookup team: {e}[/red]")
         raise typer.Exit(1)
@@ -94,11 +107,12 @@ def lookup_team(
 def lookup_user(
     user_identifier: str = typer.Argument(..., help="User ID or username to lookup"),
     profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
-    detailed: bool = typer.Option(False, "--detailed", "-d", help="Show detailed information including solves")
+    detailed: bool = typer.Option(False, "--detailed", "-d", help="Show detailed information including solves"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached challenge data")
 ):
     """Lookup information about a remote user by ID or name."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -113,19 +127,12 @@ def lookup_user(
     client = CTFdClient(str(profile_obj.url), profile_obj.token)
 
     try:
-        if not client.test_connection():
-            console.print("[red]❌ Failed to connect to CTFd[/red]")
-            raise typer.Exit(1)
-
-        user_data = None
-
-        # Try to lookup by ID first (if it's a number)
+        # Numeric identifiers are IDs; a miss there is final rather than
+        # falling through to a name search that could match someone else
         if user_identifier.isdigit():
-            user_id = int(user_identifier)
-            user_data = client.get_user_info(user_id)
-
-        # If not found or not a number, search by name
-        if not user_data:
+            user_data = client.get_user_info(int(user_identifier))
+        else:
+            # Otherwise search by name
             users = client.search_users(user_identifier)
             if users:
                 if len(users) == 1:
@@ -142,8 +149,11 @@ def lookup_user(
             raise typer.Exit(1)
 
         # Display user information
-        _display_user_info(user_data, client, detailed)
+        _display_user_info(user_data, client, detailed, refresh)
 
+    except CTFdConnectionError:
+        console.print("[red]❌ Failed to connect to CTFd[/red]")
+        raise typer.Exit(1)
     except Exception as e:
         console.print(f"[red]❌ Failed to lookup user: {e}[/red]")
         raise typer.Exit(1)
@@ -159,13 +169,12 @@ def _display_team_search_results(teams):
     table.add_column("Score", style="green", width=10)
     table.add_column("Place", style="yellow", width=8)
 
-    for team in teams:
-        table.add_row(
-            str(team.get('id', 'N/A')),
-            team.get('name', 'Unknown'),
-            str(team.get('score', 0)),
-            str(team.get('place', 'N/A'))
-        )
+    rows = [
+        (str(t.get('id', 'N/A')), t.get('name', 'Unknown'), str(t.get('score', 0)), str(t.get('place', 'N/A')))
+        for t in teams
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print("\n[cyan]💡 Tip: Use the exact team ID or name for a specific lookup[/cyan]")
@@ -182,20 +191,39 @@ def _display_user_search_results(users):
     table.add_column("Place", style="yellow", width=8)
     table.add_column("Affiliation", style="blue", width=20)
 
-    for user in users:
-        table.add_row(
-            str(user.get('id', 'N/A')),
-            user.get('name', 'Unknown'),
-            str(user.get('score', 0)),
-            str(user.get('place', 'N/A')),
-            user.get('affiliation', '-') or '-'
+    rows = [
+        (
+            str(u.get('id', 'N/A')),
+            u.get('name', 'Unknown'),
+            str(u.get('score', 0)),
+            str(u.get('place', 'N/A')),
+            u.get('affiliation') or '-',
         )
+        for u in users
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print("\n[cyan]💡 Tip: Use the exact user ID or name for a specific lookup[/cyan]")
 
 
-def _display_team_info(team_data, client, detailed=False):
+def _format_solve_time(solve_time):
+    """Format an ISO-8601 solve timestamp for display.
+
+    Args:
+        solve_time: Timestamp string from the solves API
+
+    Returns:
+        Formatted time, or the original value if it cannot be parsed
+    """
+    try:
+        return parse_datetime(solve_time).strftime('%Y-%m-%d %H:%M')
+    except (AttributeError, TypeError, ValueError):
+        return solve_time
+
+
+def _display_team_info(team_data, client, detailed=False, refresh=False):
     """Display comprehensive team information."""
 
     # Basic team info
@@ -205,82 +233,82 @@ def _display_team_info(team_data, client, detailed=False):
     team_place = team_data.get('place', 'Unknown')
 
     # Create main info panel
-    main_info = []
-    main_info.append(f"[cyan]Team ID:[/cyan] {team_id}")
-    main_info.append(f"[cyan]Team Name:[/cyan] {team_name}")
-    main_info.append(f"[cyan]Score:[/cyan] {team_score:,}")
-    main_info.append(f"[cyan]Position:[/cyan] #{team_place}")
-
-    if team_data.get('affiliation'):
-        main_info.append(f"[cyan]Affiliation:[/cyan] {team_data['affiliation']}")
-
-    if team_data.get('website'):
-        main_info.append(f"[cyan]Website:[/cyan] {team_data['website']}")
-
-    if team_data.get('country'):
-        main_info.append(f"[cyan]Country:[/cyan] {team_data['country']}")
+    optional = ((team_data.get(key), label) for key, label in _TEAM_INFO_FIELDS)
+    main_info = "\n".join([
+        f"[cyan]Team ID:[/cyan] {team_id}",
+        f"[cyan]Team Name:[/cyan] {team_name}",
+        f"[cyan]Score:[/cyan] {team_score:,}",
+        f"[cyan]Position:[/cyan] #{team_place}",
+        *(f"[cyan]{label}:[/cyan] {value}" for value, label in optional if value),
+    ])
 
     info_panel = Panel(
-        "\n".join(main_info),
+        main_info,
         title=f"👥 Team Information",
         border_style="cyan",
         padding=(1, 2)
     )
     console.print(info_panel)
 
-    # Team members if available
-    members = team_data.get('members', [])
-    if members:
-        console.print(f"\n[bold cyan]👥 Team Members ({len(members)}):[/bold cyan]")
-
-        members_table = Table(show_header=True, header_style="bold magenta")
-        members_table.add_column("ID", style="dim", width=8)
-        members_table.add_column("Name", style="cyan", min_width=15)
-        members_table.add_column("Score", style="green", width=10)
-        members_table.add_column("Role", style="yellow", width=10)
-
-        captain_id = team_data.get('captain_id')
-        for member_id in members:
-            try:
-                member_data = client.get_user_info(member_id)
-                if member_data:
-                    member_name = member_data.get('name', f'User {member_id}')
-                    member_score = member_data.get('score', 0)
-                    role = "Captain" if member_id == captain_id else "Member"
+    def fetch_solves():
+        # The challenge listing is only needed to label solves
+        solves = client.get_team_solves(int(team_id))
+        return solves, client.get_challenge_summaries(refresh) if solves else []
+
+    # Fetch the solves while the member lookups run
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        solves_future = executor.submit(fetch_solves)
+
+        # Team members if available
+        members = team_data.get('members', [])
+        if members:
+            console.print(f"\n[bold cyan]👥 Team Members ({len(members)}):[/bold cyan]")
+
+            members_table = Table(show_header=True, header_style="bold magenta")
+            members_table.add_column("ID", style="dim", width=8)
+            members_table.add_column("Name", style="cyan", min_width=15)
+            members_table.add_column("Score", style="green", width=10)
+            members_table.add_column("Role", style="yellow", width=10)
+
+            # Per-member user lookups cost one request each, so only do them
+            # when asked; otherwise show what the team response already holds
+            if detailed:
+                resolved = client.get_team_members(members)
+            else:
+                resolved = [(m.get('id'), m) if isinstance(m, dict) else (m, None) for m in members]
 
+            captain_id = team_data.get('captain_id')
+            for member_id, member_data in resolved:
+                role = "Captain" if member_id == captain_id else "Member"
+                if member_data:
                     members_table.add_row(
                         str(member_id),
-                        member_name,
-                        f"{member_score:,}",
+                        member_data.get('name', f'User {member_id}'),
+                        f"{member_data.get('score') or 0:,}",
                         role
                     )
                 else:
-                    role = "Captain" if member_id == captain_id else "Member"
                     members_table.add_row(
                         str(member_id),
                         f"User {member_id}",
-                        "Unknown",
+                        "Unknown" if detailed else "-",
                         role
                     )
-            except Exception:
-                role = "Captain" if member_id == captain_id else "Member"
-                members_table.add_row(
-                    str(member_id),
-                    f"User {member_id}",
-                    "Unknown",
-                    role
-                )
 
-        console.print(members_table)
+            console.print(members_table)
 
     # Show team solve information (always display)
     console.print(f"\n[bold green]🏆 Team Solves:[/bold green]")
     try:
-        solves = client.get_team_solves(int(team_id))
+        solves, challenges = solves_future.result()
         if solves:
-            # Get challenge information to show names
-            challenges = client.get_challenges()
-            challenge_map = {c.id: c for c in challenges}
+            # Get challenge information to show names, keeping only solved ones
+            needed_ids = {solve.get('challenge_id') for solve in solves}
+            challenge_map = {
+                c['id']: (c.get('name'), c.get('category'), c.get('value', 0))
+                for c in challenges
+                if c.get('id') in needed_ids
+            }
 
             solves_table = Table(show_header=True, header_style="bold magenta")
             solves_table.add_column("Challenge", style="cyan", min_width=20)
@@ -293,30 +321,18 @@ def _display_team_info(team_data, client, detailed=False):
                 challenge_id = solve.get('challenge_id')
                 challenge = challenge_map.get(challenge_id)
                 if challenge:
-                    challenge_name = challenge.name
-                    category = challenge.category
-                    points = challenge.value
+                    challenge_name, category, points = challenge
                     total_points += points
                 else:
                     challenge_name = f"Challenge {challenge_id}"
                     category = "Unknown"
                     points = solve.get('value', 0)
 
-                # Format solve time
-                solve_time = solve.get('date', 'Unknown')
-                if solve_time != 'Unknown':
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(solve_time.replace('Z', '+00:00'))
-                        solve_time = dt.strftime('%Y-%m-%d %H:%M')
-                    except:
-                        pass
-
                 solves_table.add_row(
                     challenge_name,
                     category,
                     str(points),
-                    solve_time
+                    _format_solve_time(solve.get('date', 'Unknown'))
                 )
 
             console.print(solves_table)
@@ -333,7 +349,7 @@ def _display_team_info(team_data, client, detailed=False):
         pass
 
 
-def _display_user_info(user_data, client, detailed=False):
+def _display_user_info(user_data, client, detailed=False, refresh=False):
     """Display comprehensive user information."""
 
     # Basic user info
@@ -343,26 +359,17 @@ def _display_user_info(user_data, client, detailed=False):
     user_place = user_data.get('place', 'Unknown')
 
     # Create main info panel
-    main_info = []
-    main_info.append(f"[cyan]User ID:[/cyan] {user_id}")
-    main_info.append(f"[cyan]Username:[/cyan] {username}")
-    main_info.append(f"[cyan]Score:[/cyan] {user_score:,}")
-    main_info.append(f"[cyan]Position:[/cyan] #{user_place}")
-
-    if user_data.get('affiliation'):
-        main_info.append(f"[cyan]Affiliation:[/cyan] {user_data['affiliation']}")
-
-    if user_data.get('website'):
-        main_info.append(f"[cyan]Website:[/cyan] {user_data['website']}")
-
-    if user_data.get('country'):
-        main_info.append(f"[cyan]Country:[/cyan] {user_data['country']}")
-
-    if user_data.get('email'):
-        main_info.append(f"[cyan]Email:[/cyan] {user_data['email']}")
+    optional = ((user_data.get(key), label) for key, label in _USER_INFO_FIELDS)
+    main_info = "\n".join([
+        f"[cyan]User ID:[/cyan] {user_id}",
+        f"[cyan]Username:[/cyan] {username}",
+        f"[cyan]Score:[/cyan] {user_score:,}",
+        f"[cyan]Position:[/cyan] #{user_place}",
+        *(f"[cyan]{label}:[/cyan] {value}" for value, label in optional if value),
+    ])
 
     info_panel = Panel(
-        "\n".join(main_info),
+        main_info,
         title=f"👤 User Information",
         border_style="cyan",
         padding=(1, 2)
@@ -372,11 +379,20 @@ def _display_user_info(user_data, client, detailed=False):
     # Show solve information (always display)
     console.print(f"\n[bold green]🏆 User Solves:[/bold green]")
     try:
-        solves = client.get_user_solves(int(user_id))
+        # Solves and challenge names are independent, fetch them together
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            solves_future = executor.submit(client.get_user_solves, int(user_id))
+            challenges_future = executor.submit(client.get_challenge_summaries, refresh)
+
+        solves = solves_future.result()
         if solves:
-            # Get challenge information to show names
-            challenges = client.get_challenges()
-            challenge_map = {c.id: c for c in challenges}
+            # Get challenge information to show names, keeping only solved ones
+            needed_ids = {solve.get('challenge_id') for solve in solves}
+            challenge_map = {
+                c['id']: (c.get('name'), c.get('category'), c.get('value', 0))
+                for c in challenges_future.result()
+                if c.get('id') in needed_ids
+            }
 
             solves_table = Table(show_header=True, header_style="bold magenta")
             solves_table.add_column("Challenge", style="cyan", min_width=20)
@@ -389,30 +405,18 @@ def _display_user_info(user_data, client, detailed=False):
                 challenge_id = solve.get('challenge_id')
                 challenge = challenge_map.get(challenge_id)
                 if challenge:
-                    challenge_name = challenge.name
-                    category = challenge.category
-                    points = challenge.value
+                    challenge_name, category, points = challenge
                     total_points += points
                 else:
                     challenge_name = f"Challenge {challenge_id}"
                     category = "Unknown"
                     points = solve.get('value', 0)
 
-                # Format solve time
-                solve_time = solve.get('date', 'Unknown')
-                if solve_time != 'Unknown':
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(solve_time.replace('Z', '+00:00'))
-                        solve_time = dt.strftime('%Y-%m-%d %H:%M')
-                    except:
-                        pass
-
                 solves_table.add_row(
                     challenge_name,
                     category,
                     str(points),
-                    solve_time
+                    _format_solve_time(solve.get('date', 'Unknown'))
                 )
 
             console.print(solves_table)
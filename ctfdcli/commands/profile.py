@@ -1,13 +1,13 @@
 """Profile management commands."""
 
 import typer
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.text import Text
 from rich.prompt import Confirm
 
-from ..core import ConfigManager
+from ..core import get_config_manager
 from ..utils import show_subcommands
 
 app = typer.Typer(help="Manage CTF profiles")
@@ -37,7 +37,7 @@ def main(ctx: typer.Context):
 @app.command("list")
 def list_profiles():
     """List all configured profiles."""
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profiles = config_manager.list_profiles()
 
     if not profiles:
@@ -69,7 +69,7 @@ def show_profile(
     name: str = typer.Argument(None, help="Profile name (default profile if not specified)")
 ):
     """Show detailed information about a profile."""
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile = config_manager.get_profile(name)
 
     if not profile:
@@ -102,7 +102,7 @@ def delete_profile(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation")
 ):
     """Delete a profile."""
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
 
     # Check if profile exists
     profile = config_manager.get_profile(name)
@@ -129,7 +129,7 @@ def set_default_profile(
     name: str = typer.Argument(..., help="Profile name to set as default")
 ):
     """Set a profile as the default."""
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
 
     if config_manager.set_default_profile(name):
         console.print(f"[green]✅ Profile '{name}' set as default[/green]")
@@ -144,7 +144,7 @@ def test_profile(
     """Test connection to a profile's CTFd instance."""
     from ..core import CTFdClient
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile = config_manager.get_profile(name)
 
     if not profile:
@@ -164,8 +164,11 @@ def test_profile(
 
             # Get additional info
             try:
-                ctf_info = client.get_ctf_info()
-                me = client.get_me()
+                # Both lookups are independent, run them side by side
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    ctf_info_future = executor.submit(client.get_ctf_info)
+                    me_future = executor.submit(client.get_me)
+                ctf_info, me = ctf_info_future.result(), me_future.result()
 
                 info_lines = [f"CTF Name: {ctf_info.name}"]
                 if me:
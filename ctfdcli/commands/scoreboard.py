@@ -1,20 +1,27 @@
 """Scoreboard display commands."""
 
 import typer
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.columns import Columns
 from rich.text import Text
-from rich.progress import Progress, BarColumn, TextColumn
 from typing import Optional
 
-from ..core import ConfigManager, CTFdClient
+from ..core import get_config_manager, CTFdClient, CTFdConnectionError
 from ..utils import show_subcommands
 
 app = typer.Typer(help="View scoreboard")
 console = Console()
 
+# Rank styles and emojis indexed by position (1-10); others fall through
+_RANK_STYLES = ("", "gold1", "bright_white", "orange3") + ("green",) * 7
+_RANK_EMOJIS = ("", "🥇", "🥈", "🥉") + ("🏆",) * 7
+
+_entry_score = attrgetter('score')
+
 
 def get_rank_style(position: int) -> str:
     """Get style for rank display.
@@ -25,16 +32,9 @@ def get_rank_style(position: int) -> str:
     Returns:
         Rich style string
     """
-    if position == 1:
-        return "gold1"
-    elif position == 2:
-        return "bright_white"
-    elif position == 3:
-        return "orange3"
-    elif position <= 10:
-        return "green"
-    else:
-        return "cyan"
+    if 0 < position < len(_RANK_STYLES):
+        return _RANK_STYLES[position]
+    return "cyan"
 
 
 def get_rank_emoji(position: int) -> str:
@@ -46,16 +46,27 @@ def get_rank_emoji(position: int) -> str:
     Returns:
         Emoji string
     """
-    if position == 1:
-        return "🥇"
-    elif position == 2:
-        return "🥈"
-    elif position == 3:
-        return "🥉"
-    elif position <= 10:
-        return "🏆"
-    else:
-        return "📊"
+    if 0 < position < len(_RANK_EMOJIS):
+        return _RANK_EMOJIS[position]
+    return "📊"
+
+
+def _current_account_names(current_user, current_team) -> set:
+    """Collect the account names that belong to the current user or team.
+
+    Args:
+        current_user: Current user, if known
+        current_team: Current team data, if known
+
+    Returns:
+        Set of names to highlight on the scoreboard
+    """
+    names = set()
+    if current_user:
+        names.add(current_user.name)
+    if current_team and current_team.get('name') is not None:
+        names.add(current_team['name'])
+    return names
 
 
 @app.callback(invoke_without_command=True)
@@ -64,23 +75,25 @@ def main(
     profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
     count: int = typer.Option(50, "--count", "-c", help="Number of entries to show"),
     me: bool = typer.Option(False, "--me", "-m", help="Highlight current user"),
-    detailed: bool = typer.Option(False, "--detailed", "-d", help="Show detailed scoreboard")
+    detailed: bool = typer.Option(False, "--detailed", "-d", help="Show detailed scoreboard"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached scoreboard data")
 ):
     """Display the CTF scoreboard."""
     if ctx.invoked_subcommand is None:
         # Show the main scoreboard when no subcommand is provided
-        show_scoreboard(profile=profile, count=count, me=me, detailed=detailed)
+        show_scoreboard(profile=profile, count=count, me=me, detailed=detailed, no_cache=no_cache)
 
 
 def show_scoreboard(
     profile: str = None,
     count: int = 50,
     me: bool = False,
-    detailed: bool = False
+    detailed: bool = False,
+    no_cache: bool = False
 ):
     """Display the CTF scoreboard."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -95,13 +108,20 @@ def show_scoreboard(
     client = CTFdClient(str(profile_obj.url), profile_obj.token)
 
     try:
-        if not client.test_connection():
-            console.print("[red]❌ Failed to connect to CTFd[/red]")
-            raise typer.Exit(1)
+        # All lookups are independent, so issue them together; the
+        # scoreboard request doubles as the connection check
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # The detailed view reports statistics over the whole field
+            scoreboard_future = executor.submit(client.get_scoreboard, None if detailed else count, no_cache)
+            ctf_info_future = executor.submit(client.get_ctf_info)
+            me_future = executor.submit(client.get_me)
+            team_future = executor.submit(client._make_request, 'GET', '/teams/me')
+
+        scoreboard = scoreboard_future.result()
 
         # Get CTF info and current user (gracefully handle failures)
         try:
-            ctf_info = client.get_ctf_info()
+            ctf_info = ctf_info_future.result()
         except Exception:
             from ..core.models import CTFInfo
             ctf_info = CTFInfo(name="CTF", mode="users")
@@ -110,21 +130,18 @@ def show_scoreboard(
         current_user = None
         current_team = None
         try:
-            current_user = client.get_me()
+            current_user = me_future.result()
         except Exception:
             pass  # Ignore if we can't get user info
 
         # Also try to get team info for team mode
         try:
-            team_data = client._make_request('GET', '/teams/me')
+            team_data = team_future.result()
             if team_data:
                 current_team = team_data
         except Exception:
             pass  # Ignore if we can't get team info
 
-        # Get scoreboard
-        scoreboard = client.get_scoreboard(count)
-
         if not scoreboard:
             console.print("[yellow]No scoreboard data available[/yellow]")
             return
@@ -134,6 +151,9 @@ def show_scoreboard(
         else:
             _display_compact_scoreboard(scoreboard, ctf_info, current_user, current_team)
 
+    except CTFdConnectionError:
+        console.print("[red]❌ Failed to connect to CTFd[/red]")
+        raise typer.Exit(1)
     except Exception as e:
         console.print(f"[red]❌ Failed to fetch scoreboard: {e}[/red]")
         raise typer.Exit(1)
@@ -146,34 +166,26 @@ def _display_compact_scoreboard(scoreboard, ctf_info, current_user, current_team
         show_header=True,
         header_style="bold magenta"
     )
-    table.add_column("Rank", style="yellow", width=8)
+    table.add_column("Rank", style="yellow", width=8, no_wrap=True, overflow="ellipsis")
     table.add_column("Team/User", style="cyan", min_width=20)
-    table.add_column("Score", style="green", width=12)
+    table.add_column("Score", style="green", width=12, no_wrap=True, overflow="ellipsis")
 
+    current_names = _current_account_names(current_user, current_team)
     for entry in scoreboard:
         rank_emoji = get_rank_emoji(entry.pos)
         rank_style = get_rank_style(entry.pos)
 
         # Highlight current user/team
         name_style = "cyan"
-        is_current_account = False
 
-        # Check if this is the current user
-        if current_user and entry.account_name == current_user.name:
-            is_current_account = True
-
-        # Check if this is the current team
-        if current_team and entry.account_name == current_team.get('name'):
-            is_current_account = True
-
-        if is_current_account:
+        if entry.account_name in current_names:
             name_style = "bold yellow"
             rank_emoji = "👤"
 
         table.add_row(
-            f"[{rank_style}]{rank_emoji} #{entry.pos}[/{rank_style}]",
-            f"[{name_style}]{entry.account_name}[/{name_style}]",
-            f"[bold green]{entry.score:,}[/bold green]"
+            Text(f"{rank_emoji} #{entry.pos}", style=rank_style),
+            Text(entry.account_name, style=name_style),
+            Text(f"{entry.score:,}", style="bold green")
         )
 
     console.print(table)
@@ -211,11 +223,12 @@ def _display_detailed_scoreboard(scoreboard, ctf_info, current_user, current_tea
         show_header=True,
         header_style="bold magenta"
     )
-    table.add_column("Rank", style="yellow", width=8)
+    table.add_column("Rank", style="yellow", width=8, no_wrap=True, overflow="ellipsis")
     table.add_column("Team/User", style="cyan", min_width=20)
-    table.add_column("Score", style="green", width=12)
-    table.add_column("Status", style="white", width=10)
+    table.add_column("Score", style="green", width=12, no_wrap=True, overflow="ellipsis")
+    table.add_column("Status", style="white", width=10, no_wrap=True, overflow="ellipsis")
 
+    current_names = _current_account_names(current_user, current_team)
     for entry in display_scoreboard:
         rank_emoji = get_rank_emoji(entry.pos)
         rank_style = get_rank_style(entry.pos)
@@ -223,17 +236,8 @@ def _display_detailed_scoreboard(scoreboard, ctf_info, current_user, current_tea
         # Highlight current user/team
         name_style = "cyan"
         status = ""
-        is_current_account = False
-
-        # Check if this is the current user
-        if current_user and entry.account_name == current_user.name:
-            is_current_account = True
-
-        # Check if this is the current team
-        if current_team and entry.account_name == current_team.get('name'):
-            is_current_account = True
 
-        if is_current_account:
+        if entry.account_name in current_names:
             name_style = "bold yellow"
             status = "👤 YOU"
 
@@ -244,9 +248,9 @@ def _display_detailed_scoreboard(scoreboard, ctf_info, current_user, current_tea
             status = "🌟 TOP 10"
 
         table.add_row(
-            f"[{rank_style}]{rank_emoji} #{entry.pos}[/{rank_style}]",
-            f"[{name_style}]{entry.account_name}[/{name_style}]",
-            f"[bold green]{entry.score:,}[/bold green]",
+            Text(f"{rank_emoji} #{entry.pos}", style=rank_style),
+            Text(entry.account_name, style=name_style),
+            Text(f"{entry.score:,}", style="bold green"),
             status
         )
 
@@ -266,7 +270,7 @@ def _display_scoreboard_stats(scoreboard, current_user):
 
     total_participants = len(scoreboard)
     top_score = scoreboard[0].score
-    avg_score = sum(entry.score for entry in scoreboard) / total_participants
+    avg_score = sum(map(_entry_score, scoreboard)) / total_participants
 
     stats = [
         f"📊 Total Participants: {total_participants}",
@@ -289,19 +293,21 @@ def _display_scoreboard_stats(scoreboard, current_user):
 @app.command("top")
 def top_players(
     profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
-    count: int = typer.Option(10, "--count", "-c", help="Number of top players to show")
+    count: int = typer.Option(10, "--count", "-c", help="Number of top players to show"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached scoreboard data")
 ):
     """Show top players only."""
-    show_scoreboard(profile=profile, count=count, detailed=True)
+    show_scoreboard(profile=profile, count=count, detailed=True, no_cache=no_cache)
 
 
 @app.command("me")
 def my_position(
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use")
+    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached scoreboard data")
 ):
     """Show your position and nearby players."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -315,20 +321,21 @@ def my_position(
     client = CTFdClient(str(profile_obj.url), profile_obj.token)
 
     try:
-        if not client.test_connection():
-            console.print("[red]❌ Failed to connect to CTFd[/red]")
-            raise typer.Exit(1)
-
-        current_user = client.get_me()
+        # Fetch the user and the full scoreboard (to find nearby players)
+        # together; the scoreboard request doubles as the connection check
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            scoreboard_future = executor.submit(client.get_scoreboard, None, no_cache)
+            me_future = executor.submit(client.get_me)
+
+        scoreboard = scoreboard_future.result()
+        current_user = me_future.result()
         if not current_user:
             console.print("[red]❌ Could not get user information[/red]")
             raise typer.Exit(1)
 
-        # Get large scoreboard to find nearby players
-        scoreboard = client.get_scoreboard(200)
-        my_entry = next((entry for entry in scoreboard if entry.account_name == current_user.name), None)
+        my_idx = next((i for i, entry in enumerate(scoreboard) if entry.account_name == current_user.name), None)
 
-        if not my_entry:
+        if my_idx is None:
             console.print("[yellow]Could not find your position in scoreboard[/yellow]")
             return
 
@@ -348,16 +355,15 @@ def my_position(
         console.print(user_panel)
 
         # Show nearby players (±5 positions)
-        my_idx = scoreboard.index(my_entry)
         start_idx = max(0, my_idx - 5)
         end_idx = min(len(scoreboard), my_idx + 6)
         nearby = scoreboard[start_idx:end_idx]
 
         table = Table(title="🔍 Nearby Players", show_header=True, header_style="bold magenta")
-        table.add_column("Rank", style="yellow", width=8)
+        table.add_column("Rank", style="yellow", width=8, no_wrap=True, overflow="ellipsis")
         table.add_column("Name", style="cyan", min_width=20)
-        table.add_column("Score", style="green", width=12)
-        table.add_column("Diff", style="red", width=10)
+        table.add_column("Score", style="green", width=12, no_wrap=True, overflow="ellipsis")
+        table.add_column("Diff", style="red", width=10, no_wrap=True, overflow="ellipsis")
 
         for entry in nearby:
             rank_emoji = get_rank_emoji(entry.pos)
@@ -373,13 +379,16 @@ def my_position(
 
             table.add_row(
                 f"{rank_emoji} #{entry.pos}",
-                f"[{name_style}]{entry.account_name}[/{name_style}]",
+                Text(entry.account_name, style=name_style),
                 f"{entry.score:,}",
                 diff_text
             )
 
         console.print(table)
 
+    except CTFdConnectionError:
+        console.print("[red]❌ Failed to connect to CTFd[/red]")
+        raise typer.Exit(1)
     except Exception as e:
         console.print(f"[red]❌ Failed to get position: {e}[/red]")
         raise typer.Exit(1)
@@ -387,11 +396,12 @@ def my_position(
 
 @app.command("stats")
 def scoreboard_stats(
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use")
+    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached scoreboard data")
 ):
     """Show detailed scoreboard statistics."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -405,24 +415,32 @@ def scoreboard_stats(
     client = CTFdClient(str(profile_obj.url), profile_obj.token)
 
     try:
-        if not client.test_connection():
-            console.print("[red]❌ Failed to connect to CTFd[/red]")
-            raise typer.Exit(1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ctf_info_future = executor.submit(client.get_ctf_info)
+            scoreboard_future = executor.submit(client.get_scoreboard, None, no_cache)
 
-        ctf_info = client.get_ctf_info()
-        scoreboard = client.get_scoreboard(200)  # Get more entries for better stats
+        scoreboard = scoreboard_future.result()
+        ctf_info = ctf_info_future.result()
 
         if not scoreboard:
             console.print("[yellow]No scoreboard data available[/yellow]")
             return
 
         # Calculate statistics
-        scores = [entry.score for entry in scoreboard]
+        scores = list(map(_entry_score, scoreboard))
         total_participants = len(scores)
-        max_score = max(scores)
-        min_score = min(scores)
+
+        # CTFd returns standings best-first, so reversing gives ascending
+        # order without a sort; only sort if that ordering does not hold
+        if all(a >= b for a, b in zip(scores, scores[1:])):
+            ascending = scores[::-1]
+        else:
+            ascending = sorted(scores)
+
+        max_score = ascending[-1]
+        min_score = ascending[0]
         avg_score = sum(scores) / total_participants
-        median_score = sorted(scores)[total_participants // 2]
+        median_score = ascending[total_participants // 2]
 
         # Score distribution
         ranges = [
@@ -433,10 +451,11 @@ def scoreboard_stats(
             (5001, float('inf'), "5K+")
         ]
 
-        distribution = {}
-        for low, high, label in ranges:
-            count = len([s for s in scores if low <= s <= high])
-            distribution[label] = count
+        # Two binary searches over the sorted scores count each range
+        distribution = {
+            label: bisect_right(ascending, high) - bisect_left(ascending, low)
+            for low, high, label in ranges
+        }
 
         # Display stats
         stats_table = Table(title=f"📈 {ctf_info.name} - Statistics", show_header=True, header_style="bold magenta")
@@ -463,6 +482,9 @@ def scoreboard_stats(
 
         console.print(dist_table)
 
+    except CTFdConnectionError:
+        console.print("[red]❌ Failed to connect to CTFd[/red]")
+        raise typer.Exit(1)
     except Exception as e:
         console.print(f"[red]❌ Failed to get statistics: {e}[/red]")
         raise typer.Exit(1)
\ No newline at end of file
@@ -1,13 +1,15 @@
 """Flag submission commands."""
 
+import time
 import typer
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
-from typing import Optional
+from typing import Dict, Optional
 
-from ..core import ConfigManager, CTFdClient
+from ..core import get_config_manager, CTFdClient
 from ..utils import show_subcommands
 
 app = typer.Typer(help="Submit flags")
@@ -41,7 +43,7 @@ def main(
         )
         return
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -60,8 +62,7 @@ def main(
             raise typer.Exit(1)
 
         # Get challenge info first
-        challenges = client.get_challenges()
-        challenge = next((c for c in challenges if c.id == challenge_id), None)
+        challenge = client.get_challenge(challenge_id)
 
         if not challenge:
             console.print(f"[red]Challenge with ID {challenge_id} not found[/red]")
@@ -130,12 +131,31 @@ def main(
         raise typer.Exit(1)
 
 
+def _challenge_names(client: CTFdClient, refresh: bool = False) -> Dict[int, str]:
+    """Map challenge IDs to names using the challenge listing.
+
+    Args:
+        client: CTFd client
+        refresh: Bypass the cached listing
+
+    Returns:
+        Dictionary mapping challenge ID to name
+    """
+    return {
+        c['id']: c.get('name', f"Challenge {c['id']}")
+        for c in client.get_challenge_summaries(refresh=refresh)
+        if 'id' in c
+    }
+
+
 @app.command("bulk")
 def bulk_submit(
     file_path: str = typer.Argument(..., help="Path to file with challenge_id:flag pairs"),
     profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
     delimiter: str = typer.Option(":", "--delimiter", "-d", help="Delimiter for ID:flag pairs"),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be submitted without actually submitting")
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be submitted without actually submitting"),
+    concurrency: int = typer.Option(4, "--concurrency", "-j", help="Number of flags to submit at once"),
+    rate_limit: float = typer.Option(0.0, "--rate-limit", help="Seconds to wait between batches of submissions")
 ):
     """Submit multiple flags from a file.
 
@@ -144,11 +164,9 @@ def bulk_submit(
     1:flag{example1}
     2:CTF{another_flag}
     """
-
-    import os
     from pathlib import Path
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -173,23 +191,20 @@ def bulk_submit(
                 if not line or line.startswith('#'):
                     continue
 
-                if delimiter not in line:
+                id_text, found, flag = line.partition(delimiter)
+                if not found:
                     console.print(f"[yellow]Warning: Line {line_num} doesn't contain delimiter '{delimiter}': {line}[/yellow]")
                     continue
 
-                parts = line.split(delimiter, 1)
-                if len(parts) != 2:
-                    console.print(f"[yellow]Warning: Line {line_num} has invalid format: {line}[/yellow]")
-                    continue
-
+                # int() ignores surrounding whitespace itself
                 try:
-                    challenge_id = int(parts[0].strip())
-                    flag = parts[1].strip()
-                    submissions.append((challenge_id, flag))
+                    challenge_id = int(id_text)
                 except ValueError:
-                    console.print(f"[yellow]Warning: Line {line_num} has invalid challenge ID: {parts[0]}[/yellow]")
+                    console.print(f"[yellow]Warning: Line {line_num} has invalid challenge ID: {id_text}[/yellow]")
                     continue
 
+                submissions.append((challenge_id, flag.strip()))
+
     except Exception as e:
         console.print(f"[red]Error reading file: {e}[/red]")
         raise typer.Exit(1)
@@ -222,22 +237,37 @@ def bulk_submit(
             console.print("[red]❌ Failed to connect to CTFd[/red]")
             raise typer.Exit(1)
 
-        # Get challenges for validation
-        challenges = client.get_challenges()
-        challenge_map = {c.id: c for c in challenges}
+        # Get challenge names for validation from the (cached) listing,
+        # refetching once if the cache predates a newly released challenge
+        challenge_map = _challenge_names(client)
+        if any(challenge_id not in challenge_map for challenge_id, _ in submissions):
+            challenge_map = _challenge_names(client, refresh=True)
 
-        # Submit flags
+        # Submit flags in batches of up to `concurrency` parallel requests,
+        # optionally pausing between batches to stay under rate limits
+        batch_size = max(1, concurrency)
         results = []
-        for challenge_id, flag in submissions:
-            if challenge_id not in challenge_map:
-                results.append((challenge_id, flag, False, "Challenge not found"))
-                continue
-
-            challenge = challenge_map[challenge_id]
-            console.print(f"[cyan]Submitting flag for '{challenge.name}' (ID: {challenge_id})...[/cyan]")
-
-            success, message = client.submit_flag(challenge_id, flag)
-            results.append((challenge_id, flag, success, message))
+        with ThreadPoolExecutor(max_workers=batch_size) as executor:
+            for start in range(0, len(submissions), batch_size):
+                if start and rate_limit > 0:
+                    time.sleep(rate_limit)
+
+                batch = submissions[start:start + batch_size]
+                futures = []
+                for challenge_id, flag in batch:
+                    if challenge_id not in challenge_map:
+                        futures.append(None)
+                        continue
+
+                    console.print(f"[cyan]Submitting flag for '{challenge_map[challenge_id]}' (ID: {challenge_id})...[/cyan]")
+                    futures.append(executor.submit(client.submit_flag, challenge_id, flag))
+
+                for (challenge_id, flag), future in zip(batch, futures):
+                    if future is None:
+                        results.append((challenge_id, flag, False, "Challenge not found"))
+                    else:
+                        success, message = future.result()
+                        results.append((challenge_id, flag, success, message))
 
         # Show results
         results_table = Table(title="📊 Bulk Submission Results", show_header=True, header_style="bold magenta")
@@ -248,7 +278,7 @@ def bulk_submit(
 
         correct_count = 0
         for challenge_id, flag, success, message in results:
-            challenge_name = challenge_map.get(challenge_id, {}).name if challenge_id in challenge_map else "Unknown"
+            challenge_name = challenge_map.get(challenge_id, "Unknown")
             status = "✅ Correct" if success else "❌ Incorrect"
 
             if success:
@@ -282,7 +312,7 @@ def submission_history(
 
     console.print("[yellow]Note: Submission history depends on CTFd instance permissions[/yellow]")
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
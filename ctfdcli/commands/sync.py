@@ -2,8 +2,15 @@
 
 import os
 import json
+import hashlib
+import re
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 import typer
 from rich.console import Console
 from rich.progress import Progress, TaskID, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
@@ -11,35 +18,93 @@ from rich.panel import Panel
 from rich.table import Table
 from tqdm import tqdm
 
-from ..core import ConfigManager, CTFdClient, Challenge
+from ..core import get_config_manager, CTFdClient, Challenge
 from ..utils import show_subcommands
+from .challenges import parse_connection_info
 
 app = typer.Typer(help="Sync challenges and files")
 console = Console()
 
+# Footer line written by create_challenge_readme
+_CHALLENGE_ID_RE = re.compile(r'\*Challenge ID: (\d+)')
+
+# Bytes read from the end of a README when looking for the footer
+_README_TAIL_BYTES = 1024
+
 
 def load_sync_metadata(output_dir: Path) -> Dict:
     """Load sync metadata from .ctfdcli directory.
 
+    The index file holds the sync time and profile; each synced challenge
+    has its own file under .ctfdcli/challenges.
+
     Args:
         output_dir: Output directory path
 
     Returns:
         Dictionary containing sync metadata
     """
-    metadata_file = output_dir / ".ctfdcli" / "sync_metadata.json"
+    metadata = {"synced_challenges": {}, "last_sync": None, "profile": None}
+    metadata_dir = output_dir / ".ctfdcli"
+    metadata_file = metadata_dir / "sync_metadata.json"
     if metadata_file.exists():
         try:
             with open(metadata_file, 'r') as f:
-                return json.load(f)
+                metadata.update(json.load(f))
+        except Exception:
+            pass
+
+    # Older syncs kept every challenge in the index; per-challenge files win
+    synced_challenges = metadata.setdefault("synced_challenges", {})
+    for challenge_file in (metadata_dir / "challenges").glob("*.json"):
+        try:
+            synced_challenges[challenge_file.stem] = json.loads(challenge_file.read_text())
         except Exception:
             pass
-    return {"synced_challenges": {}, "last_sync": None, "profile": None}
+
+    return metadata
+
+
+def save_challenge_metadata(output_dir: Path, challenge_key: str, entry: Dict):
+    """Save one challenge's sync metadata to its own file.
+
+    Args:
+        output_dir: Output directory path
+        challenge_key: Challenge ID as used in synced_challenges
+        entry: Metadata entry to save
+    """
+    challenges_dir = output_dir / ".ctfdcli" / "challenges"
+    challenge_file = challenges_dir / f"{challenge_key}.json"
+
+    try:
+        data = json.dumps(entry, indent=2, default=str)
+        tmp_file = challenge_file.with_suffix('.json.tmp')
+
+        # The directory only needs creating on the first save
+        try:
+            f = open(tmp_file, 'w')
+        except FileNotFoundError:
+            challenges_dir.mkdir(parents=True, exist_ok=True)
+            f = open(tmp_file, 'w')
+
+        # Swap the file into place so an interrupted sync never leaves a
+        # truncated entry behind
+        with f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, challenge_file)
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not save metadata for challenge {challenge_key}: {e}[/yellow]")
 
 
 def save_sync_metadata(output_dir: Path, metadata: Dict):
     """Save sync metadata to .ctfdcli directory.
 
+    Only the index is rewritten; challenge entries are saved individually
+    with save_challenge_metadata as they sync. Entries that do not have a
+    file yet (e.g. from an older sync) are written out here.
+
     Args:
         output_dir: Output directory path
         metadata: Metadata dictionary to save
@@ -48,9 +113,24 @@ def save_sync_metadata(output_dir: Path, metadata: Dict):
     metadata_dir.mkdir(exist_ok=True)
     metadata_file = metadata_dir / "sync_metadata.json"
 
+    synced_challenges = metadata.get("synced_challenges", {})
+    if synced_challenges:
+        saved = {path.stem for path in (metadata_dir / "challenges").glob("*.json")}
+        for challenge_key, entry in synced_challenges.items():
+            if challenge_key not in saved:
+                save_challenge_metadata(output_dir, challenge_key, entry)
+
     try:
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2, default=str)
+        # Serialise up front so the file is written in one call, then swap
+        # it into place so an interrupted write never corrupts the old file
+        index = {key: value for key, value in metadata.items() if key != "synced_challenges"}
+        data = json.dumps(index, indent=2, default=str)
+        tmp_file = metadata_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, metadata_file)
     except Exception as e:
         console.print(f"[yellow]Warning: Could not save sync metadata: {e}[/yellow]")
 
@@ -67,13 +147,19 @@ def detect_challenge_context() -> Optional[int]:
     readme_path = cwd / "README.md"
     if readme_path.exists():
         try:
-            with open(readme_path, 'r') as f:
-                content = f.read()
+            with open(readme_path, 'rb') as f:
                 # Look for challenge ID pattern at the end
-                import re
-                match = re.search(r'\*Challenge ID: (\d+)', content)
-                if match:
-                    return int(match.group(1))
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - _README_TAIL_BYTES))
+                match = _CHALLENGE_ID_RE.search(f.read().decode('utf-8', 'ignore'))
+
+                # Fall back to the whole file in case notes were added below it
+                if not match and size > _README_TAIL_BYTES:
+                    f.seek(0)
+                    match = _CHALLENGE_ID_RE.search(f.read().decode('utf-8', 'ignore'))
+
+            if match:
+                return int(match.group(1))
         except Exception:
             pass
 
@@ -96,6 +182,21 @@ def detect_sync_root() -> Optional[Path]:
     return None
 
 
+def _replace_path_separators(name: str) -> str:
+    """Replace characters that can't appear in a directory name.
+
+    Args:
+        name: Raw name
+
+    Returns:
+        Name with path separators and colons replaced by underscores
+    """
+    # Chained replace beats str.translate here: each pass is a C-level scan
+    # that returns the same string when the character is absent
+    return name.replace('/', '_').replace('\\', '_').replace(':', '_')
+
+
+@lru_cache(maxsize=1024)
 def normalize_category_name(category: str) -> str:
     """Normalize category name for filesystem usage.
 
@@ -109,10 +210,11 @@ def normalize_category_name(category: str) -> str:
         return "misc"
 
     # Clean category name for filesystem
-    safe_category = category.strip().replace('/', '_').replace('\\', '_').replace(':', '_')
+    safe_category = _replace_path_separators(category.strip())
     return safe_category
 
 
+@lru_cache(maxsize=1024)
 def normalize_challenge_name(name: str) -> str:
     """Normalize challenge name for filesystem usage.
 
@@ -122,7 +224,7 @@ def normalize_challenge_name(name: str) -> str:
     Returns:
         Filesystem-safe challenge name
     """
-    return name.replace('/', '_').replace('\\', '_').replace(':', '_')
+    return _replace_path_separators(name)
 
 
 def create_challenge_readme(challenge: Challenge, challenge_dir: Path):
@@ -154,7 +256,7 @@ def create_challenge_readme(challenge: Challenge, challenge_dir: Path):
     else:
         attempts_info += "/∞"
 
-    readme_content = f"""# {challenge.name}
+    parts = [f"""# {challenge.name}
 
 {status_emoji} **Status:** {status_text}
 🏷️ **Category:** {challenge.category}
@@ -185,56 +287,221 @@ def create_challenge_readme(challenge: Challenge, challenge_dir: Path):
 
 ## Connection
 
-"""
+"""]
 
     # Add connection information if available
     if challenge.connection_info:
         # Parse connection info using the same function from challenges.py
-        from ..commands.challenges import parse_connection_info
         connection = parse_connection_info(challenge.connection_info)
         if connection:
-            readme_content += f"**Type:** {connection['icon']} {connection['type'].title()}\n"
-            readme_content += f"**Host:** `{connection['host']}`\n"
-            readme_content += f"**Port:** `{connection['port']}`\n"
-            readme_content += f"**Command:** `{connection['command']}`\n"
+            parts.append(f"**Type:** {connection.icon} {connection.type.title()}\n")
+            parts.append(f"**Host:** `{connection.host}`\n")
+            parts.append(f"**Port:** `{connection.port}`\n")
+            parts.append(f"**Command:** `{connection.command}`\n")
         else:
-            readme_content += f"**Info:** `{challenge.connection_info}`\n"
+            parts.append(f"**Info:** `{challenge.connection_info}`\n")
     else:
-        readme_content += "_No connection information provided_\n"
+        parts.append("_No connection information provided_\n")
 
-    readme_content += f"""
+    parts.append(f"""
 ## Files
 
-"""
+""")
 
     if challenge.files:
         for file_url in challenge.files:
             filename = file_url.split('/')[-1].split('?')[0]  # Remove query parameters
-            readme_content += f"- 📁 `{filename}`\n"
+            parts.append(f"- 📁 `{filename}`\n")
     else:
-        readme_content += "_No files provided_\n"
+        parts.append("_No files provided_\n")
 
-    readme_content += f"""
+    parts.append(f"""
 ## Hints
 
-"""
+""")
 
     if challenge.hints:
         for i, hint in enumerate(challenge.hints, 1):
             hint_content = hint.get('content', 'No content') if isinstance(hint, dict) else str(hint)
-            readme_content += f"{i}. {hint_content}\n"
+            parts.append(f"{i}. {hint_content}\n")
     else:
-        readme_content += "_No hints available_\n"
+        parts.append("_No hints available_\n")
 
-    readme_content += f"""
+    parts.append(f"""
 ---
 *Generated by CTFd CLI*
 *Challenge ID: {challenge.id} | Status: {status_text}*
-"""
+""")
 
     readme_path = challenge_dir / "README.md"
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
+    readme_path.write_text("".join(parts), encoding='utf-8')
+
+
+def _challenge_fingerprint(challenge: Challenge) -> str:
+    """Fingerprint the challenge fields that decide whether it needs syncing.
+
+    Args:
+        challenge: Challenge object
+
+    Returns:
+        Short hex digest stored in the sync metadata
+    """
+    fields = [challenge.name, challenge.description, challenge.solved_by_me, challenge.connection_info, challenge.files]
+    return hashlib.blake2b(json.dumps(fields).encode(), digest_size=8).hexdigest()
+
+
+def _sync_challenge(
+    challenge: Challenge,
+    output_path: Path,
+    client: CTFdClient,
+    download_executor: ThreadPoolExecutor,
+    create_readme: bool,
+    download_files: bool,
+    force: bool,
+    created_dirs: Set[Path],
+    stored_entry: Dict,
+    shared_downloads: Dict[str, Tuple[Path, Future]],
+    shared_downloads_lock: threading.Lock
+) -> Dict:
+    """Create a challenge's directory, README and files.
+
+    Args:
+        challenge: Challenge object
+        output_path: Sync root directory
+        client: CTFd client used for downloads
+        download_executor: Executor the file downloads are submitted to
+        create_readme: Whether to write README.md
+        download_files: Whether to download challenge files
+        force: Overwrite existing README and files
+        created_dirs: Category directories already created during this sync
+        stored_entry: Metadata entry from the previous sync (empty if none)
+        shared_downloads: Downloads started during this sync, keyed by URL
+            without its query string, with the path each is saved to
+        shared_downloads_lock: Lock guarding shared_downloads
+
+    Returns:
+        Sync metadata entry for the challenge
+    """
+    # Use helper functions for normalization
+    category_dir = output_path / normalize_category_name(challenge.category)
+    if category_dir not in created_dirs:
+        category_dir.mkdir(exist_ok=True)
+        created_dirs.add(category_dir)
+
+    # Create challenge directory
+    challenge_dir = category_dir / normalize_challenge_name(challenge.name)
+    challenge_dir.mkdir(exist_ok=True)
+
+    # Create README if requested
+    if create_readme:
+        readme_path = challenge_dir / "README.md"
+        if not readme_path.exists() or force:
+            create_challenge_readme(challenge, challenge_dir)
+
+    # ETag and size of each downloaded file, keyed by filename
+    files_meta = dict(stored_entry.get("files_meta", {}))
+
+    # Download files if requested
+    if download_files and challenge.files:
+        # Use file URLs directly from challenge data (already have valid tokens)
+        file_urls = []
+        for file in challenge.files:
+            if file.startswith('http'):
+                file_urls.append(file)
+            elif file.startswith('/files/'):
+                file_urls.append(f"{client.base_url}{file}")
+            else:
+                file_path = file.lstrip('/')
+                file_urls.append(f"{client.base_url}/files/{file_path}")
+
+        downloaded_files = []
+        failed_files = []
+        pending_files = []
+
+        # Print the challenge's file log in one go so lines from challenges
+        # syncing in parallel don't interleave
+        log_lines = []
+
+        for file_url in file_urls:
+            # Extract filename from URL (handle query parameters)
+            filename = file_url.split('/')[-1].split('?')[0]
+            if not filename:
+                filename = f"file_{len(downloaded_files) + len(pending_files)}"
+
+            local_file_path = challenge_dir / filename
+
+            if not local_file_path.exists():
+                pending_files.append((filename, file_url, local_file_path, None))
+            elif force:
+                # Let the server skip files that haven't changed since the
+                # last download, as long as the local copy looks intact
+                file_meta = files_meta.get(filename, {})
+                etag = file_meta.get("etag") if file_meta.get("size") == local_file_path.stat().st_size else None
+                pending_files.append((filename, file_url, local_file_path, etag))
+            else:
+                downloaded_files.append(filename)
+                log_lines.append(f"[blue]  ≈ Skipped {filename} (already exists)[/blue]")
+
+        # Fetch the missing files together and report them in their original
+        # order. Attachments shared between challenges only differ in their
+        # download token, so each is fetched once and copied to the others.
+        download_futures = []
+        for filename, file_url, local_file_path, etag in pending_files:
+            shared_key = file_url.split('?')[0]
+            with shared_downloads_lock:
+                shared = shared_downloads.get(shared_key)
+                if shared is None:
+                    future = download_executor.submit(
+                        client.download_file_if_changed, file_url, str(local_file_path), etag
+                    )
+                    shared_downloads[shared_key] = (local_file_path, future)
+
+            if shared is None:
+                download_futures.append((filename, local_file_path, future, None))
+            else:
+                source_path, source_future = shared
+                download_futures.append((filename, local_file_path, source_future, source_path))
+
+        for filename, local_file_path, future, source_path in download_futures:
+            try:
+                success, downloaded, etag = future.result()
+                if success:
+                    downloaded_files.append(filename)
+                    if source_path is not None and source_path != local_file_path:
+                        shutil.copyfile(source_path, local_file_path)
+                        log_lines.append(f"[green]  ✓ Copied {filename} (shared with another challenge)[/green]")
+                    elif downloaded:
+                        log_lines.append(f"[green]  ✓ Downloaded {filename}[/green]")
+                    else:
+                        log_lines.append(f"[blue]  ≈ Skipped {filename} (not modified)[/blue]")
+
+                    if etag:
+                        files_meta[filename] = {"etag": etag, "size": local_file_path.stat().st_size}
+                    else:
+                        files_meta.pop(filename, None)
+                else:
+                    failed_files.append(filename)
+                    log_lines.append(f"[yellow]  ✗ Failed to download {filename}[/yellow]")
+            except Exception as e:
+                failed_files.append(filename)
+                log_lines.append(f"[red]  ✗ Error downloading {filename}: {e}[/red]")
+
+        # Summary of file operations
+        if downloaded_files or failed_files:
+            log_lines.append(f"[cyan]  Files for {challenge.name}: {len(downloaded_files)} downloaded, {len(failed_files)} failed[/cyan]")
+            console.print("\n".join(log_lines))
+
+    return {
+        "name": challenge.name,
+        "description": challenge.description,
+        "category": challenge.category,
+        "solved_by_me": challenge.solved_by_me,
+        "connection_info": challenge.connection_info,
+        "files": challenge.files,
+        "fp": _challenge_fingerprint(challenge),
+        "files_meta": files_meta,
+        "last_synced": str(Path().cwd())  # Add timestamp
+    }
 
 
 @app.callback(invoke_without_command=True)
@@ -263,7 +530,8 @@ def sync_challenges(
     create_readme: bool = typer.Option(True, "--readme/--no-readme", help="Create README files"),
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing files"),
     incremental: bool = typer.Option(True, "--incremental/--full", help="Only sync new/changed challenges"),
-    current: bool = typer.Option(False, "--current", help="Sync only the current challenge (if in challenge directory)")
+    current: bool = typer.Option(False, "--current", help="Sync only the current challenge (if in challenge directory)"),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Number of challenges to sync and files to download at once")
 ):
     """Sync challenges from CTFd platform."""
 
@@ -288,14 +556,11 @@ def sync_challenges(
 
     # Determine output directory
     if output_dir is None:
-        if detected_sync_root:
-            output_dir = str(detected_sync_root)
-        elif detect_sync_root():
-            output_dir = str(detect_sync_root())
-        else:
-            output_dir = "challenges"
+        if not detected_sync_root:
+            detected_sync_root = detect_sync_root()
+        output_dir = str(detected_sync_root) if detected_sync_root else "challenges"
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -358,25 +623,12 @@ def sync_challenges(
         # Filter challenges for incremental sync
         original_count = len(challenges)
         if incremental and not force:
-            new_challenges = []
-            for challenge in challenges:
-                challenge_key = str(challenge.id)
-                stored_challenge = synced_challenges.get(challenge_key, {})
-
-                # Check if challenge needs syncing
-                needs_sync = (
-                    challenge_key not in synced_challenges or
-                    stored_challenge.get("name") != challenge.name or
-                    stored_challenge.get("description") != challenge.description or
-                    stored_challenge.get("solved_by_me") != challenge.solved_by_me or
-                    stored_challenge.get("connection_info") != challenge.connection_info or
-                    stored_challenge.get("files") != challenge.files
-                )
-
-                if needs_sync:
-                    new_challenges.append(challenge)
-
-            challenges = new_challenges
+            # Check which challenges need syncing with one lookup each
+            stored_fingerprints = {key: entry.get("fp") for key, entry in synced_challenges.items()}
+            challenges = [
+                challenge for challenge in challenges
+                if stored_fingerprints.get(str(challenge.id)) != _challenge_fingerprint(challenge)
+            ]
 
             if original_count > 0 and len(challenges) == 0:
                 console.print("[green]✅ All challenges are up to date![/green]")
@@ -402,103 +654,42 @@ def sync_challenges(
             skipped_count = 0
             failed_count = 0
 
-            for challenge in challenges:
-                # Solve status is already included in challenge data
-
-                # Use helper functions for normalization
-                category_name = normalize_category_name(challenge.category)
-                safe_category = category_name
-                category_dir = output_path / safe_category
-                category_dir.mkdir(exist_ok=True)
-
-                # Create challenge directory
-                safe_challenge_name = normalize_challenge_name(challenge.name)
-                challenge_dir = category_dir / safe_challenge_name
-                challenge_dir.mkdir(exist_ok=True)
-
-                progress.update(
-                    sync_task,
-                    description=f"Syncing {challenge.name}..."
-                )
-
-                try:
-                    # Create README if requested
-                    if create_readme:
-                        readme_path = challenge_dir / "README.md"
-                        if not readme_path.exists() or force:
-                            create_challenge_readme(challenge, challenge_dir)
-
-                    # Download files if requested
-                    if download_files and challenge.files:
-                        progress.update(
-                            sync_task,
-                            description=f"Downloading files for {challenge.name}..."
-                        )
-
-                        # Use file URLs directly from challenge data (already have valid tokens)
-                        file_urls = []
-                        for file in challenge.files:
-                            if file.startswith('http'):
-                                file_urls.append(file)
-                            elif file.startswith('/files/'):
-                                file_urls.append(f"{client.base_url}{file}")
-                            else:
-                                file_path = file.lstrip('/')
-                                file_urls.append(f"{client.base_url}/files/{file_path}")
-
-                        downloaded_files = []
-                        failed_files = []
-
-                        for file_url in file_urls:
-                            # Extract filename from URL (handle query parameters)
-                            filename = file_url.split('/')[-1].split('?')[0]
-                            if not filename:
-                                filename = f"file_{len(downloaded_files)}"
-
-                            local_file_path = challenge_dir / filename
-
-                            if not local_file_path.exists() or force:
-                                console.print(f"[cyan]  Downloading {filename}...[/cyan]")
-                                try:
-                                    if client.download_file(file_url, str(local_file_path)):
-                                        downloaded_files.append(filename)
-                                        console.print(f"[green]  ✓ Downloaded {filename}[/green]")
-                                    else:
-                                        failed_files.append(filename)
-                                        console.print(f"[yellow]  ✗ Failed to download {filename}[/yellow]")
-                                except Exception as e:
-                                    failed_files.append(filename)
-                                    console.print(f"[red]  ✗ Error downloading {filename}: {e}[/red]")
-                            else:
-                                downloaded_files.append(filename)
-                                console.print(f"[blue]  ≈ Skipped {filename} (already exists)[/blue]")
-
-                        # Summary of file operations
-                        if downloaded_files or failed_files:
-                            console.print(f"[cyan]  Files for {challenge.name}: {len(downloaded_files)} downloaded, {len(failed_files)} failed[/cyan]")
-
-                    synced_count += 1
-
-                    # Update metadata for successfully synced challenge
-                    challenge_key = str(challenge.id)
-                    synced_challenges[challenge_key] = {
-                        "name": challenge.name,
-                        "description": challenge.description,
-                        "category": challenge.category,
-                        "solved_by_me": challenge.solved_by_me,
-                        "connection_info": challenge.connection_info,
-                        "files": challenge.files,
-                        "last_synced": str(Path().cwd())  # Add timestamp
-                    }
-
-                except Exception as e:
-                    console.print(f"[red]Failed to sync {challenge.name}: {e}[/red]")
-                    failed_count += 1
-
-                progress.update(sync_task, advance=1)
+            # Challenges are independent and their work is mostly network and
+            # disk I/O, so sync several at once. --concurrency sizes both the
+            # challenge pool and the download pool they share; challenge
+            # workers make no requests themselves, so at most that many
+            # connections are open at a time.
+            workers = max(1, concurrency)
+            with ThreadPoolExecutor(max_workers=workers) as download_executor, \
+                    ThreadPoolExecutor(max_workers=workers) as executor:
+                created_dirs = set()
+                shared_downloads = {}
+                shared_downloads_lock = threading.Lock()
+                futures = {
+                    executor.submit(
+                        _sync_challenge, challenge, output_path, client,
+                        download_executor, create_readme, download_files, force,
+                        created_dirs, synced_challenges.get(str(challenge.id), {}),
+                        shared_downloads, shared_downloads_lock
+                    ): challenge
+                    for challenge in challenges
+                }
+
+                for future in as_completed(futures):
+                    challenge = futures[future]
+                    try:
+                        # Update metadata for successfully synced challenge
+                        challenge_key = str(challenge.id)
+                        synced_challenges[challenge_key] = future.result()
+                        save_challenge_metadata(output_path, challenge_key, synced_challenges[challenge_key])
+                        synced_count += 1
+                    except Exception as e:
+                        console.print(f"[red]Failed to sync {challenge.name}: {e}[/red]")
+                        failed_count += 1
+
+                    progress.update(sync_task, advance=1)
 
         # Save sync metadata
-        from datetime import datetime
         metadata["synced_challenges"] = synced_challenges
         metadata["last_sync"] = datetime.now().isoformat()
         metadata["profile"] = profile_obj.name if hasattr(profile_obj, 'name') else str(profile_obj.url)
@@ -543,7 +734,8 @@ def sync_status(
     """Show sync status and statistics."""
 
     # Handle CWD context detection for status command
-    if output_dir is None:
+    auto_detect = output_dir is None
+    if auto_detect:
         detected_sync_root = detect_sync_root()
         if detected_sync_root:
             output_dir = str(detected_sync_root)
@@ -555,7 +747,8 @@ def sync_status(
 
     if not output_path.exists():
         console.print(f"[yellow]Output directory '{output_path}' does not exist[/yellow]")
-        if detect_sync_root():
+        # Auto-detection has already come up empty if it chose the path
+        if not auto_detect and detect_sync_root():
             console.print("[yellow]Hint: You might be in a subdirectory. Try running from the main sync directory.[/yellow]")
         return
 
@@ -576,12 +769,19 @@ def sync_status(
     total_challenges = 0
     exclude_dirs = {".ctfdcli", "__pycache__", ".git", ".vscode"}
 
-    for category_dir in output_path.iterdir():
-        if category_dir.is_dir() and category_dir.name not in exclude_dirs:
-            challenge_count = len([d for d in category_dir.iterdir() if d.is_dir() and not d.name.startswith('.')])
-            if challenge_count > 0:  # Only show categories with challenges
-                categories.append((category_dir.name, challenge_count))
-                total_challenges += challenge_count
+    # scandir reports entry types from the directory listing itself, so
+    # telling directories apart doesn't need a stat per entry
+    with os.scandir(output_path) as category_entries:
+        for category_entry in category_entries:
+            if category_entry.is_dir() and category_entry.name not in exclude_dirs:
+                with os.scandir(category_entry.path) as challenge_entries:
+                    challenge_count = sum(
+                        1 for entry in challenge_entries
+                        if entry.is_dir() and not entry.name.startswith('.')
+                    )
+                if challenge_count > 0:  # Only show categories with challenges
+                    categories.append((category_entry.name, challenge_count))
+                    total_challenges += challenge_count
 
     if not categories:
         console.print("[yellow]No synced challenges found[/yellow]")
@@ -7,7 +7,7 @@ from rich.panel import Panel
 from rich.text import Text
 from typing import Optional
 
-from ..core import ConfigManager, CTFdClient
+from ..core import get_config_manager, CTFdClient
 
 app = typer.Typer(help="View team information")
 console = Console()
@@ -23,7 +23,7 @@ def main(
     if ctx.invoked_subcommand is not None:
         return
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -242,7 +242,7 @@ def list_members(
 ):
     """List team members only."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -299,7 +299,7 @@ def team_stats(
 ):
     """Show team statistics and performance."""
 
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     profile_obj = config_manager.get_profile(profile)
 
     if not profile_obj:
@@ -319,7 +319,7 @@ def team_stats(
         team_data = client._make_request('GET', '/teams/me')
 
         # Get scoreboard for comparison
-        scoreboard = client.get_scoreboard(100)
+        scoreboard = client.get_scoreboard(None)
         team_name = team_data.get('name')
 
         # Find team in scoreboard
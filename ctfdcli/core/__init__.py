@@ -1,13 +1,16 @@
 """Core functionality for CTFd CLI."""
 
-from .api_client import CTFdClient, CTFdAPIError
-from .config import ConfigManager
+from .api_client import CTFdClient, CTFdAPIError, CTFdConnectionError, CTFdNotFoundError
+from .config import ConfigManager, get_config_manager
 from .models import *
 
 __all__ = [
     'CTFdClient',
     'CTFdAPIError',
+    'CTFdConnectionError',
+    'CTFdNotFoundError',
     'ConfigManager',
+    'get_config_manager',
     'Challenge',
     'User',
     'Team',
@@ -1,20 +1,55 @@
 """CTFd API client for interacting with CTFd platforms."""
 
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from rich.console import Console
 
+from . import cache
 from .models import Challenge, User, Team, ScoreboardEntry, CTFInfo, Submission
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Seconds a fetched challenge list stays valid within one process
+CHALLENGES_CACHE_TTL = 60
+
+# (base_url, token) -> (fetched_at, challenges)
+_challenges_cache: Dict[Tuple[str, str], Tuple[float, List[Challenge]]] = {}
+
+# Maximum concurrent per-challenge detail requests
+CHALLENGE_DETAIL_WORKERS = 8
+
+# Seconds on-disk responses stay valid across invocations
+CHALLENGE_SUMMARIES_CACHE_TTL = 300
+SCOREBOARD_CACHE_TTL = 30
+
+# Read and write size for file downloads
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
 
 class CTFdAPIError(Exception):
     """Custom exception for CTFd API errors."""
     pass
 
 
+class CTFdConnectionError(CTFdAPIError):
+    """Raised when CTFd is unreachable or rejects the API token."""
+    pass
+
+
+class CTFdNotFoundError(CTFdAPIError):
+    """Raised when the requested resource does not exist (HTTP 404)."""
+    pass
+
+
 class CTFdClient:
     """CTFd API client."""
 
@@ -32,14 +67,23 @@ class CTFdClient:
         self.timeout = timeout
         self.console = Console()
 
-        # Setup session with retry strategy
+        # Index of the flag submission endpoint that last answered, so later
+        # submissions on this client skip endpoints that are known to 404
+        self._submit_attempt_index: Optional[int] = None
+
+        # Setup session with retry strategy and a keep-alive connection pool
+        # large enough for concurrent requests against the same host
         self.session = requests.Session()
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -62,6 +106,8 @@ class CTFdClient:
             API response data
 
         Raises:
+            CTFdConnectionError: If CTFd is unreachable or the token is rejected
+            CTFdNotFoundError: If the endpoint returns 404
             CTFdAPIError: If API request fails
         """
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
@@ -73,12 +119,20 @@ class CTFdClient:
             response.raise_for_status()
 
             if response.content:
-                data = response.json()
+                data = _json_loads(response.content)
                 if not data.get('success', True):
                     raise CTFdAPIError(f"API Error: {data.get('message', 'Unknown error')}")
                 return data.get('data', data)
             return {}
 
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise CTFdConnectionError(f"Request failed: {str(e)}")
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 401:
+                raise CTFdConnectionError(f"Request failed: {str(e)}")
+            if e.response is not None and e.response.status_code == 404:
+                raise CTFdNotFoundError(f"Request failed: {str(e)}")
+            raise CTFdAPIError(f"Request failed: {str(e)}")
         except requests.exceptions.RequestException as e:
             raise CTFdAPIError(f"Request failed: {str(e)}")
         except ValueError as e:
@@ -197,45 +251,132 @@ class CTFdClient:
 
         return CTFInfo(**ctf_info)
 
-    def get_challenges(self) -> List[Challenge]:
+    def get_challenges(self, refresh: bool = False) -> List[Challenge]:
         """Get all visible challenges.
 
+        Per-challenge detail requests are issued concurrently. Results are
+        cached per instance and token for CHALLENGES_CACHE_TTL seconds so
+        repeated lookups in one process skip the network.
+
+        Args:
+            refresh: Bypass the cache and fetch fresh data
+
         Returns:
             List of challenges
         """
+        key = (self.base_url, self.token)
+        cached = _challenges_cache.get(key)
+        if not refresh and cached and time.monotonic() - cached[0] < CHALLENGES_CACHE_TTL:
+            return list(cached[1])
+
         data = self._make_request('GET', '/challenges')
-        challenges = []
+        if not data:
+            return []
 
-        for challenge_data in data:
+        def fetch(challenge_data: Dict[str, Any]) -> Challenge:
             # Get detailed challenge info
             detailed = self._make_request('GET', f"/challenges/{challenge_data['id']}")
 
             # Check if solved_by_me is available in the base data or detailed data
             solved_by_me = challenge_data.get('solved_by_me', detailed.get('solved_by_me', False))
 
-            # Get current attempt count
-            attempts = self.get_challenge_attempts(detailed['id'])
-
-            challenge = Challenge(
-                id=detailed['id'],
-                name=detailed['name'],
-                description=detailed['description'],
-                category=detailed['category'],
-                value=detailed['value'],
-                tags=detailed.get('tags', []),
-                state=detailed.get('state', 'visible'),
-                max_attempts=detailed.get('max_attempts'),
-                type=detailed.get('type', 'standard'),
-                solves=detailed.get('solves', 0),
-                files=detailed.get('files', []),
-                hints=detailed.get('hints', []),
-                solved_by_me=solved_by_me,
-                attempts=attempts,
-                connection_info=detailed.get('connection_info')
-            )
-            challenges.append(challenge)
+            return self._build_challenge(detailed, solved_by_me)
+
+        with ThreadPoolExecutor(max_workers=min(CHALLENGE_DETAIL_WORKERS, len(data))) as executor:
+            challenges = list(executor.map(fetch, data))
+
+        _challenges_cache[key] = (time.monotonic(), challenges)
+        return list(challenges)
+
+    def get_challenge_summaries(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get the challenge listing without per-challenge detail requests.
+
+        The listing is cached on disk per instance and token for
+        CHALLENGE_SUMMARIES_CACHE_TTL seconds so repeated CLI invocations
+        can skip the request.
 
-        return challenges
+        Args:
+            refresh: Bypass the disk cache and fetch fresh data
+
+        Returns:
+            List of challenge summaries (id, name, category, value, ...)
+        """
+        cache_key = self._cache_key()
+        data = None if refresh else cache.load('challenges', cache_key, CHALLENGE_SUMMARIES_CACHE_TTL)
+        if not isinstance(data, list):
+            data = self._make_request('GET', '/challenges')
+            # Only keep a real listing; caching an odd response would hide
+            # every challenge name until it expires
+            if isinstance(data, list):
+                cache.store('challenges', cache_key, data)
+            else:
+                data = []
+
+        return data
+
+    def _cache_key(self, *parts: Any) -> str:
+        """Build a disk cache key scoped to this instance and token.
+
+        Args:
+            *parts: Extra key components (e.g. a count)
+
+        Returns:
+            Cache key string
+        """
+        return "\n".join([self.base_url, self.token, *map(str, parts)])
+
+    def get_challenge(self, challenge_id: int) -> Optional[Challenge]:
+        """Get a single challenge by ID.
+
+        Args:
+            challenge_id: Challenge ID
+
+        Returns:
+            Challenge or None if not found
+
+        Raises:
+            CTFdAPIError: If the request fails for a reason other than a 404
+        """
+        try:
+            detailed = self._make_request('GET', f'/challenges/{challenge_id}')
+        except CTFdNotFoundError:
+            return None
+
+        if not detailed:
+            return None
+
+        return self._build_challenge(detailed, detailed.get('solved_by_me', False))
+
+    def _build_challenge(self, detailed: Dict[str, Any], solved_by_me: bool) -> Challenge:
+        """Build a Challenge model from a detailed challenge response.
+
+        Args:
+            detailed: Response data from /challenges/{id}
+            solved_by_me: Whether the current account solved the challenge
+
+        Returns:
+            Challenge model
+        """
+        # Get current attempt count
+        attempts = self.get_challenge_attempts(detailed['id'])
+
+        return Challenge(
+            id=detailed['id'],
+            name=detailed['name'],
+            description=detailed['description'],
+            category=detailed['category'],
+            value=detailed['value'],
+            tags=detailed.get('tags', []),
+            state=detailed.get('state', 'visible'),
+            max_attempts=detailed.get('max_attempts'),
+            type=detailed.get('type', 'standard'),
+            solves=detailed.get('solves', 0),
+            files=detailed.get('files', []),
+            hints=detailed.get('hints', []),
+            solved_by_me=solved_by_me,
+            attempts=attempts,
+            connection_info=detailed.get('connection_info')
+        )
 
     def get_challenge_attempts(self, challenge_id: int) -> int:
         """Get current attempt count for a challenge.
@@ -302,20 +443,47 @@ class CTFdClient:
         Returns:
             True if successful, False otherwise
         """
+        success, _, _ = self.download_file_if_changed(url, local_path)
+        return success
+
+    def download_file_if_changed(
+        self,
+        url: str,
+        local_path: str,
+        etag: Optional[str] = None
+    ) -> Tuple[bool, bool, Optional[str]]:
+        """Download a file from CTFd unless the server reports it unchanged.
+
+        Args:
+            url: File URL
+            local_path: Local file path to save
+            etag: ETag of the copy already at local_path, sent as If-None-Match
+
+        Returns:
+            Tuple of (success, downloaded, etag); downloaded is False when the
+            server answered 304 Not Modified and the local copy was kept
+        """
+        headers = {'If-None-Match': etag} if etag else None
+
         try:
-            response = self.session.get(url, stream=True, timeout=self.timeout)
-            response.raise_for_status()
+            # Close the streamed response so its connection goes back to the
+            # session pool for the next request
+            with self.session.get(url, stream=True, timeout=self.timeout, headers=headers) as response:
+                if etag and response.status_code == 304:
+                    return True, False, etag
 
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                response.raise_for_status()
 
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
 
-            return True
+                with open(local_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+
+                return True, True, response.headers.get('ETag')
         except Exception as e:
             self.console.print(f"[red]Failed to download {url}: {e}[/red]")
-            return False
+            return False, False, None
 
     def submit_flag(self, challenge_id: int, flag: str) -> Tuple[bool, str]:
         """Submit a flag for a challenge.
@@ -351,9 +519,14 @@ class CTFdClient:
             }
         ]
 
+        # Try the endpoint that worked last time first
+        attempts = list(enumerate(submission_attempts))
+        if self._submit_attempt_index is not None:
+            attempts.insert(0, attempts.pop(self._submit_attempt_index))
+
         last_error = None
 
-        for attempt in submission_attempts:
+        for index, attempt in attempts:
             try:
                 # Debug: print the endpoint and payload being tried
                 self.console.print(f"[blue]Trying endpoint: {attempt['endpoint']} with payload: {attempt['payload']}[/blue]", style="dim")
@@ -363,6 +536,7 @@ class CTFdClient:
                     attempt['endpoint'],
                     json=attempt['payload']
                 )
+                self._submit_attempt_index = index
 
                 # Handle different response formats
                 if isinstance(data, dict):
@@ -381,6 +555,12 @@ class CTFdClient:
                         (message.lower().startswith('correct') and not message.lower().startswith('incorrect'))
                     )
 
+                    if is_correct:
+                        # Solve state changed, drop the cached challenge list
+                        _challenges_cache.pop((self.base_url, self.token), None)
+                        cache.invalidate('challenges', self._cache_key())
+                        cache.invalidate('scoreboard')
+
                     return is_correct, message
                 else:
                     # Unexpected response format
@@ -393,6 +573,7 @@ class CTFdClient:
 
                 # If we get a specific error that's not a 404, it might be the right endpoint
                 if '404' not in error_msg and '403' not in error_msg:
+                    self._submit_attempt_index = index
                     return False, error_msg
                 continue
 
@@ -402,16 +583,33 @@ class CTFdClient:
         else:
             return False, f"Could not find working submission endpoint. Last error: {last_error}"
 
-    def get_scoreboard(self, count: int = 50) -> List[ScoreboardEntry]:
+    def get_scoreboard(self, count: Optional[int] = 50, refresh: bool = False) -> List[ScoreboardEntry]:
         """Get scoreboard.
 
+        CTFd always returns the full standings, so the raw response is cached
+        on disk once for SCOREBOARD_CACHE_TTL seconds and only the first
+        count entries are parsed into models.
+
         Args:
-            count: Number of entries to retrieve
+            count: Number of entries to retrieve (None for all)
+            refresh: Bypass the disk cache and fetch fresh data
 
         Returns:
             List of scoreboard entries
         """
-        data = self._make_request('GET', f'/scoreboard?count={count}')
+        cache_key = self._cache_key()
+        data = None if refresh else cache.load('scoreboard', cache_key, SCOREBOARD_CACHE_TTL)
+        if not isinstance(data, list):
+            data = self._make_request('GET', '/scoreboard')
+            # An empty body comes back as {}; treat it as no standings and
+            # don't keep it around
+            if isinstance(data, list):
+                cache.store('scoreboard', cache_key, data)
+            else:
+                data = []
+
+        if count is not None:
+            data = data[:max(count, 0)]
 
         entries = []
         for i, entry in enumerate(data, 1):
@@ -547,9 +745,14 @@ class CTFdClient:
 
         Returns:
             Team information dictionary or None if not found
+
+        Raises:
+            CTFdConnectionError: If CTFd is unreachable or the token is rejected
         """
         try:
             return self._make_request('GET', f'/teams/{team_id}')
+        except CTFdConnectionError:
+            raise
         except CTFdAPIError:
             return None
 
@@ -561,12 +764,56 @@ class CTFdClient:
 
         Returns:
             User information dictionary or None if not found
+
+        Raises:
+            CTFdConnectionError: If CTFd is unreachable or the token is rejected
         """
         try:
             return self._make_request('GET', f'/users/{user_id}')
+        except CTFdConnectionError:
+            raise
         except CTFdAPIError:
             return None
 
+    def get_team_members(
+        self, members: List[Any], max_workers: int = 10
+    ) -> List[Tuple[int, Optional[Dict[str, Any]]]]:
+        """Resolve a team's members to their user information.
+
+        Some CTFd versions embed full user objects in a team's ``members``
+        array; those are used as-is. Any bare user IDs are fetched
+        concurrently over the shared session in a single batch.
+
+        Args:
+            members: The ``members`` array from a team response
+            max_workers: Maximum number of concurrent user requests
+
+        Returns:
+            List of (user_id, user information or None) in team order
+        """
+        resolved: List[Tuple[int, Optional[Dict[str, Any]]]] = []
+        missing = []
+        for member in members:
+            if isinstance(member, dict):
+                resolved.append((member.get('id'), member))
+            else:
+                missing.append(len(resolved))
+                resolved.append((member, None))
+
+        def fetch(user_id: int) -> Optional[Dict[str, Any]]:
+            try:
+                return self.get_user_info(user_id)
+            except CTFdAPIError:
+                return None
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                fetched = executor.map(fetch, [resolved[i][0] for i in missing])
+                for i, user_data in zip(missing, fetched):
+                    resolved[i] = (resolved[i][0], user_data)
+
+        return resolved
+
     def get_team_solves(self, team_id: int) -> List[Dict[str, Any]]:
         """Get solved challenges for a specific team.
 
@@ -603,6 +850,9 @@ class CTFdClient:
 
         Returns:
             List of teams matching the search
+
+        Raises:
+            CTFdConnectionError: If CTFd is unreachable or the token is rejected
         """
         try:
             # Try to get all teams and filter by name
@@ -611,6 +861,8 @@ class CTFdClient:
             if isinstance(teams_data, list):
                 return [team for team in teams_data if name.lower() in team.get('name', '').lower()]
             return []
+        except CTFdConnectionError:
+            raise
         except CTFdAPIError:
             return []
 
@@ -622,6 +874,9 @@ class CTFdClient:
 
         Returns:
             List of users matching the search
+
+        Raises:
+            CTFdConnectionError: If CTFd is unreachable or the token is rejected
         """
         try:
             # Try to get all users and filter by name
@@ -629,5 +884,7 @@ class CTFdClient:
             if isinstance(users_data, list):
                 return [user for user in users_data if name.lower() in user.get('name', '').lower()]
             return []
+        except CTFdConnectionError:
+            raise
         except CTFdAPIError:
             return []
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""On-disk TTL cache for CTFd API responses shared across CLI invocations."""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+    _json_loads = json.loads
+
+CACHE_DIR = Path.home() / ".cache" / "ctfdcli"
+
+
+def _cache_path(namespace: str, key: str) -> Path:
+    """Get the cache file path for an entry.
+
+    Args:
+        namespace: Cache namespace (e.g. "scoreboard")
+        key: Entry key, hashed so secrets never appear in filenames
+
+    Returns:
+        Cache file path
+    """
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return CACHE_DIR / f"{namespace}-{digest}.json"
+
+
+def load(namespace: str, key: str, ttl: float) -> Optional[Any]:
+    """Load a cached value if it is younger than ttl seconds.
+
+    Args:
+        namespace: Cache namespace
+        key: Entry key
+        ttl: Maximum age in seconds
+
+    Returns:
+        Cached value, or None if missing, expired or unreadable
+    """
+    path = _cache_path(namespace, key)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        return _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def store(namespace: str, key: str, value: Any):
+    """Store a JSON-serialisable value in the cache.
+
+    Caching is best effort; write failures are ignored.
+
+    Args:
+        namespace: Cache namespace
+        key: Entry key
+        value: Value to store
+    """
+    path = _cache_path(namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(_json_dumps(value))
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def invalidate(namespace: str, key: Optional[str] = None):
+    """Remove one cached entry, or every entry in a namespace.
+
+    Args:
+        namespace: Cache namespace
+        key: Entry key (None to clear the whole namespace)
+    """
+    paths = [_cache_path(namespace, key)] if key is not None else CACHE_DIR.glob(f"{namespace}-*.json")
+    for path in paths:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
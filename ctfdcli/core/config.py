@@ -3,11 +3,13 @@
 import os
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 
 from .models import CTFProfile
 
+_config_manager: Optional["ConfigManager"] = None
+
 
 class ConfigManager:
     """Manages CTF profiles and configuration."""
@@ -19,6 +21,9 @@ class ConfigManager:
         self.config_file = self.config_dir / "profiles.json"
         self.ensure_config_directory()
 
+        # (mtime_ns, size) of profiles.json -> parsed profiles
+        self._profiles_cache: Optional[Tuple[Tuple[int, int], Dict[str, CTFProfile]]] = None
+
     def _get_config_directory(self) -> Path:
         """Get configuration directory path.
 
@@ -40,25 +45,34 @@ class ConfigManager:
     def load_profiles(self) -> Dict[str, CTFProfile]:
         """Load all profiles from configuration.
 
+        Parsed profiles are cached until profiles.json changes on disk.
+
         Returns:
             Dictionary of profile name to profile
         """
-        if not self.config_file.exists():
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
             return {}
 
-        try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._profiles_cache is None or self._profiles_cache[0] != stamp:
+            try:
+                with open(self.config_file, 'r') as f:
+                    data = json.load(f)
 
-            profiles = {}
-            for name, profile_data in data.items():
-                profiles[name] = CTFProfile(**profile_data)
+                profiles = {}
+                for name, profile_data in data.items():
+                    profiles[name] = CTFProfile(**profile_data)
 
-            return profiles
+            except (json.JSONDecodeError, ValueError) as e:
+                self.console.print(f"[red]Error loading profiles: {e}[/red]")
+                return {}
 
-        except (json.JSONDecodeError, ValueError) as e:
-            self.console.print(f"[red]Error loading profiles: {e}[/red]")
-            return {}
+            self._profiles_cache = (stamp, profiles)
+
+        # Hand out copies so callers can modify profiles before saving
+        return {name: profile.model_copy() for name, profile in self._profiles_cache[1].items()}
 
     def save_profiles(self, profiles: Dict[str, CTFProfile]):
         """Save profiles to configuration.
@@ -74,6 +88,8 @@ class ConfigManager:
             with open(self.config_file, 'w') as f:
                 json.dump(data, f, indent=2, default=str)
 
+            self._profiles_cache = None
+
         except Exception as e:
             self.console.print(f"[red]Error saving profiles: {e}[/red]")
             raise
@@ -229,4 +245,16 @@ class ConfigManager:
         """
         workspace_dir = self.config_dir / "workspaces" / profile_name
         workspace_dir.mkdir(parents=True, exist_ok=True)
-        return workspace_dir
\ No newline at end of file
+        return workspace_dir
+
+
+def get_config_manager() -> ConfigManager:
+    """Get the shared configuration manager for this process.
+
+    Returns:
+        ConfigManager instance, created on first use
+    """
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager